@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+import functools
 import pyvirtualcam
 from typing import Tuple, Optional, List
 import argparse
@@ -14,6 +15,67 @@ except ImportError:
     MEDIAPIPE_AVAILABLE = False
 
 
+def remap_filter(build_maps, *, prefilter=None):
+    """Turn a (h_frame, w_frame) -> (map_x, map_y) builder into a filter method.
+    
+    Used as ``apply_x = remap_filter(_x_maps)`` in the class body, so the builder
+    stays a plain static function and apply_x keeps the (self, frame, face) signature.
+    
+    The maps only depend on the frame size, so they are built once and reused for
+    every frame instead of being recomputed with full-frame NumPy math each time.
+    """
+    # Builders are staticmethods in the class body; unwrap for Pythons where those aren't callable
+    build_maps = getattr(build_maps, '__func__', build_maps)
+    
+    def apply(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
+        map1, map2 = cached_remap_maps(build_maps, *frame.shape[:2])
+        source = prefilter(frame) if prefilter else frame
+        return cv2.remap(source, map1, map2, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+    # Only the docstring carries over; the builder's (h_frame, w_frame) signature must not
+    apply.__doc__ = build_maps.__doc__
+    return apply
+
+
+# Shared across filters: holding the current filter's maps is what matters, and a
+# bounded cache keeps cycling through every distortion from pinning ~5 MB each
+@functools.lru_cache(maxsize=8)
+def cached_remap_maps(build_maps, h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
+    map_x, map_y = build_maps(h_frame, w_frame)
+    # remap converts float maps to this fixed-point form internally on every call
+    return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+
+def blur_15(frame: np.ndarray) -> np.ndarray:
+    return cv2.GaussianBlur(frame, (15, 15), 0)
+
+
+def zoom_about_center(frame: np.ndarray, zoom_factor: float) -> np.ndarray:
+    """Zoom around the frame center; the affine warp needs no per-pixel coordinate grids"""
+    h_frame, w_frame = frame.shape[:2]
+    center_x = w_frame // 2
+    center_y = h_frame // 2
+    scale = 1.0 / zoom_factor
+    M = np.float32([[scale, 0, center_x * (1 - scale)], [0, scale, center_y * (1 - scale)]])
+    # Not bit-exact with the old meshgrid + remap: warpAffine and remap quantize the
+    # sample coordinates differently, so high-contrast pixels can shift by ~10 levels
+    return cv2.warpAffine(frame, M, (w_frame, h_frame), flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                          borderMode=cv2.BORDER_REPLICATE)
+
+
+@functools.lru_cache(maxsize=2)
+def spiral_polar_grid(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-size part of spiral_zoom: distance, ripple phase and angle cos/sin of each pixel"""
+    center_x = w_frame // 2
+    center_y = h_frame // 2
+    y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
+    dx = x_coords - center_x
+    dy = y_coords - center_y
+    dist = np.sqrt(dx*dx + dy*dy)
+    angle = np.arctan2(dy, dx)
+    max_dist = np.sqrt(center_x*center_x + center_y*center_y)
+    return dist, dist / max_dist * 4 * np.pi, np.cos(angle), np.sin(angle)
+
+
 class FaceFilter:
     def __init__(self, width: int = 1280, height: int = 720, fps: int = 30):
         self.width = width
@@ -110,8 +172,8 @@ class FaceFilter:
         return [(x, y, w, h) for (x, y, w, h) in faces]
     
         
-    def apply_bulge(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _bulge_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -135,7 +197,9 @@ class FaceFilter:
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
         
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_bulge = remap_filter(_bulge_maps)
         
     def apply_stretch(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
         x, y, w, h = face
@@ -162,9 +226,8 @@ class FaceFilter:
         result = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
         return result
         
-    def apply_swirl(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        result = frame.copy()
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _swirl_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -193,12 +256,12 @@ class FaceFilter:
         map_x[mask] = new_x[mask]
         map_y[mask] = new_y[mask]
         
-        result = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
-        return result
+        return map_x, map_y
+
+    apply_swirl = remap_filter(_swirl_maps)
         
-    def apply_fisheye(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        result = frame.copy()
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _fisheye_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -222,12 +285,12 @@ class FaceFilter:
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
         
-        result = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
-        return result
+        return map_x, map_y
+
+    apply_fisheye = remap_filter(_fisheye_maps)
         
-    def apply_pinch(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        result = frame.copy()
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _pinch_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -259,11 +322,12 @@ class FaceFilter:
         map_x[mask] = new_x[mask]
         map_y[mask] = new_y[mask]
         
-        result = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
-        return result
+        return map_x, map_y
+
+    apply_pinch = remap_filter(_pinch_maps)
         
-    def apply_wave(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _wave_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_y = h_frame // 2
         
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -278,7 +342,9 @@ class FaceFilter:
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
         
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_wave = remap_filter(_wave_maps)
         
     def apply_mirror_split(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
         result = frame.copy()
@@ -759,9 +825,8 @@ class FaceFilter:
         shifted = np.roll(frame, 10, axis=1)
         return cv2.addWeighted(frame, 0.5, shifted, 0.5, 0)
     
-    def apply_zoom_blur(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        result = frame.copy()
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _zoom_blur_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         
@@ -780,11 +845,12 @@ class FaceFilter:
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
         
-        blurred = cv2.GaussianBlur(result, (15, 15), 0)
-        return cv2.remap(blurred, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_zoom_blur = remap_filter(_zoom_blur_maps, prefilter=blur_15)
     
-    def apply_melt(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _melt_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
         
         melt_strength = 30.0
@@ -793,7 +859,9 @@ class FaceFilter:
         map_x = x_coords.astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
         
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_melt = remap_filter(_melt_maps)
     
     def apply_kaleidoscope(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
         h, w = frame.shape[:2]
@@ -847,12 +915,12 @@ class FaceFilter:
         return np.clip(glow, 0, 255)
     
     def apply_solarize(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        result = frame.astype(np.float32)
         threshold = 128
-        mask = result > threshold
-        solarized = result.copy()
-        solarized[mask] = 255 - result[mask]
-        return np.clip(solarized, 0, 255).astype(np.uint8)
+        # Inverting values above the threshold is exact in uint8; a 256-entry table
+        # avoids round-tripping the whole frame through float32
+        lut = np.arange(256, dtype=np.uint8)
+        lut[threshold + 1:] = 255 - lut[threshold + 1:]
+        return cv2.LUT(frame, lut)
     
     def apply_edge_detect(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
@@ -867,8 +935,8 @@ class FaceFilter:
         halftone = (halftone // 64) * 64
         return cv2.cvtColor(halftone, cv2.COLOR_GRAY2BGR)
     
-    def apply_twirl(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _twirl_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -884,10 +952,12 @@ class FaceFilter:
         new_y = center_y + dist * np.sin(new_angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_twirl = remap_filter(_twirl_maps)
     
-    def apply_ripple(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _ripple_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -902,10 +972,12 @@ class FaceFilter:
         new_y = y_coords + ripple * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_ripple = remap_filter(_ripple_maps)
     
-    def apply_sphere(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _sphere_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -922,10 +994,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_sphere = remap_filter(_sphere_maps)
     
-    def apply_tunnel(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _tunnel_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -942,10 +1016,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_tunnel = remap_filter(_tunnel_maps)
     
-    def apply_water_ripple(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _water_ripple_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -960,10 +1036,12 @@ class FaceFilter:
         new_y = y_coords + ripple * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_water_ripple = remap_filter(_water_ripple_maps)
     
-    def apply_radial_blur(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _radial_blur_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -978,11 +1056,12 @@ class FaceFilter:
         new_y = y_coords + offset * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        blurred = cv2.GaussianBlur(frame, (15, 15), 0)
-        return cv2.remap(blurred, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_radial_blur = remap_filter(_radial_blur_maps, prefilter=blur_15)
     
-    def apply_cylinder(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _cylinder_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
         dx = x_coords - center_x
@@ -990,10 +1069,12 @@ class FaceFilter:
         new_x = center_x + dx * (1.0 - cylinder_strength * (dx / (w_frame // 2))**2)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = y_coords.astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_cylinder = remap_filter(_cylinder_maps)
     
-    def apply_barrel(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _barrel_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -1010,10 +1091,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_barrel = remap_filter(_barrel_maps)
     
-    def apply_pincushion(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _pincushion_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -1030,10 +1113,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_pincushion = remap_filter(_pincushion_maps)
     
-    def apply_whirlpool(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _whirlpool_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -1050,10 +1135,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(new_angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_whirlpool = remap_filter(_whirlpool_maps)
     
-    def apply_radial_zoom(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _radial_zoom_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1067,10 +1154,12 @@ class FaceFilter:
         new_y = center_y + dy * zoom_factor
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_radial_zoom = remap_filter(_radial_zoom_maps)
     
-    def apply_concave(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _concave_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -1087,10 +1176,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_concave = remap_filter(_concave_maps)
     
-    def apply_convex(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _convex_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -1107,10 +1198,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_convex = remap_filter(_convex_maps)
     
-    def apply_spiral(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _spiral_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         radius = min(w_frame, h_frame) // 2
@@ -1125,10 +1218,12 @@ class FaceFilter:
         new_y = center_y + dist * np.sin(spiral_angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_spiral = remap_filter(_spiral_maps)
     
-    def apply_radial_stretch(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _radial_stretch_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1142,10 +1237,12 @@ class FaceFilter:
         new_y = center_y + dist * stretch_factor * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_radial_stretch = remap_filter(_radial_stretch_maps)
     
-    def apply_radial_compress(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _radial_compress_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1159,10 +1256,12 @@ class FaceFilter:
         new_y = center_y + dist * compress_factor * np.sin(angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_radial_compress = remap_filter(_radial_compress_maps)
     
-    def apply_vertical_wave(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _vertical_wave_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
         wave_amplitude = 25.0
@@ -1172,10 +1271,12 @@ class FaceFilter:
         new_y = y_coords + wave_phase
         map_x = new_x.astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_vertical_wave = remap_filter(_vertical_wave_maps)
     
-    def apply_horizontal_wave(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _horizontal_wave_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
         wave_amplitude = 25.0
@@ -1185,10 +1286,12 @@ class FaceFilter:
         new_y = y_coords
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = new_y.astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_horizontal_wave = remap_filter(_horizontal_wave_maps)
     
-    def apply_skew_horizontal(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _skew_horizontal_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
         skew_strength = 0.3
@@ -1197,10 +1300,12 @@ class FaceFilter:
         new_y = y_coords
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = new_y.astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_skew_horizontal = remap_filter(_skew_horizontal_maps)
     
-    def apply_skew_vertical(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _skew_vertical_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
         skew_strength = 0.3
@@ -1209,10 +1314,12 @@ class FaceFilter:
         new_y = y_coords + offset
         map_x = new_x.astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_skew_vertical = remap_filter(_skew_vertical_maps)
     
-    def apply_rotate_zoom(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _rotate_zoom_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1229,10 +1336,12 @@ class FaceFilter:
         new_y = center_y + new_dist * np.sin(new_angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_rotate_zoom = remap_filter(_rotate_zoom_maps)
     
-    def apply_radial_wave(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _radial_wave_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1248,10 +1357,12 @@ class FaceFilter:
         new_y = center_y + dist * np.sin(new_angle)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_radial_wave = remap_filter(_radial_wave_maps)
     
-    def apply_zoom_in(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _zoom_in_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1262,10 +1373,12 @@ class FaceFilter:
         new_y = center_y + dy / zoom_factor
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_zoom_in = remap_filter(_zoom_in_maps)
     
-    def apply_zoom_out(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _zoom_out_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1276,40 +1389,22 @@ class FaceFilter:
         new_y = center_y + dy / zoom_factor
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_zoom_out = remap_filter(_zoom_out_maps)
     
     def apply_fast_zoom_in(self, frame: np.ndarray, face: Tuple[int, int, int, int], frame_count: int = 0) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
-        center_x = w_frame // 2
-        center_y = h_frame // 2
         fps = 30.0
         animation_speed = 2.0
         zoom_factor = 1.0 + (frame_count / fps * animation_speed) % 2.0
-        y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        new_x = center_x + dx / zoom_factor
-        new_y = center_y + dy / zoom_factor
-        map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
-        map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return zoom_about_center(frame, zoom_factor)
     
     def apply_fast_zoom_out(self, frame: np.ndarray, face: Tuple[int, int, int, int], frame_count: int = 0) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
-        center_x = w_frame // 2
-        center_y = h_frame // 2
         fps = 30.0
         animation_speed = 2.0
         zoom_factor = 1.5 - (frame_count / fps * animation_speed) % 1.0
         zoom_factor = max(0.5, zoom_factor)
-        y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        new_x = center_x + dx / zoom_factor
-        new_y = center_y + dy / zoom_factor
-        map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
-        map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return zoom_about_center(frame, zoom_factor)
     
     def apply_shake(self, frame: np.ndarray, face: Tuple[int, int, int, int], frame_count: int = 0) -> np.ndarray:
         h_frame, w_frame = frame.shape[:2]
@@ -1322,21 +1417,11 @@ class FaceFilter:
         return cv2.warpAffine(frame, M, (w_frame, h_frame), borderMode=cv2.BORDER_REPLICATE)
     
     def apply_pulse(self, frame: np.ndarray, face: Tuple[int, int, int, int], frame_count: int = 0) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
-        center_x = w_frame // 2
-        center_y = h_frame // 2
         fps = 30.0
         animation_speed = 3.0
         animation_cycle = (frame_count / fps * animation_speed * 2 * np.pi) % (2 * np.pi)
         zoom_factor = 1.0 + 0.15 * np.sin(animation_cycle)
-        y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        new_x = center_x + dx / zoom_factor
-        new_y = center_y + dy / zoom_factor
-        map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
-        map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return zoom_about_center(frame, zoom_factor)
     
     def apply_spiral_zoom(self, frame: np.ndarray, face: Tuple[int, int, int, int], frame_count: int = 0) -> np.ndarray:
         h_frame, w_frame = frame.shape[:2]
@@ -1345,17 +1430,14 @@ class FaceFilter:
         fps = 30.0
         animation_speed = 2.0
         animation_cycle = (frame_count / fps * animation_speed * 2 * np.pi) % (2 * np.pi)
-        y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        dist = np.sqrt(dx*dx + dy*dy)
-        angle = np.arctan2(dy, dx)
-        max_dist = np.sqrt(center_x*center_x + center_y*center_y)
-        zoom_factor = 1.0 + 0.3 * np.sin(dist / max_dist * 4 * np.pi + animation_cycle)
-        new_angle = angle + animation_cycle * 0.5
+        dist, phase, cos_angle, sin_angle = spiral_polar_grid(h_frame, w_frame)
+        zoom_factor = 1.0 + 0.3 * np.sin(phase + animation_cycle)
         new_dist = dist / zoom_factor
-        new_x = center_x + new_dist * np.cos(new_angle)
-        new_y = center_y + new_dist * np.sin(new_angle)
+        # Rotating by a constant angle: expand cos/sin(angle + turn) instead of per-pixel trig
+        cos_turn = np.cos(animation_cycle * 0.5)
+        sin_turn = np.sin(animation_cycle * 0.5)
+        new_x = center_x + new_dist * (cos_angle * cos_turn - sin_angle * sin_turn)
+        new_y = center_y + new_dist * (sin_angle * cos_turn + cos_angle * sin_turn)
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
         return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
@@ -1480,8 +1562,8 @@ class FaceFilter:
         
         return result
     
-    def apply_rotate(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _rotate_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1494,13 +1576,15 @@ class FaceFilter:
         new_y = center_y + dx * sin_a + dy * cos_a
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_rotate = remap_filter(_rotate_maps)
     
     def apply_rotate_45(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
         return self.apply_rotate(frame, face)
     
-    def apply_rotate_90(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
-        h_frame, w_frame = frame.shape[:2]
+    @staticmethod
+    def _rotate_90_maps(h_frame: int, w_frame: int) -> Tuple[np.ndarray, np.ndarray]:
         center_x = w_frame // 2
         center_y = h_frame // 2
         y_coords, x_coords = np.meshgrid(np.arange(h_frame), np.arange(w_frame), indexing='ij')
@@ -1513,7 +1597,9 @@ class FaceFilter:
         new_y = center_y + dx * sin_a + dy * cos_a
         map_x = np.clip(new_x, 0, w_frame - 1).astype(np.float32)
         map_y = np.clip(new_y, 0, h_frame - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return map_x, map_y
+
+    apply_rotate_90 = remap_filter(_rotate_90_maps)
     
     def apply_flip_horizontal(self, frame: np.ndarray, face: Tuple[int, int, int, int]) -> np.ndarray:
         return cv2.flip(frame, 1)
@@ -2,12 +2,107 @@ import cv2
 import numpy as np
 import sys
 import os
+import functools
+import contextlib
+import logging
+import logging.handlers
+import queue
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing import util as mp_util
+from typing import Tuple, Optional, List
 from face_filters import FaceFilter
 
+ANIMATED_FILTERS = frozenset({
+    'extreme_closeup', 'puzzle', 'fast_zoom_in', 'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom'
+})
 
-def create_test_face_image():
-    img = np.zeros((720, 1280, 3), dtype=np.uint8)
-    img.fill(50)
+FULL_IMAGE_FILTERS = frozenset({
+    'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
+    'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
+    'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
+    'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
+    'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
+    'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'rotate',
+    'rotate_45', 'rotate_90', 'flip_horizontal', 'flip_vertical',
+    'flip_both', 'quad_mirror', 'tile', 'radial_tile',
+    'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
+    'black_white', 'sepia', 'vintage', 'negative', 'posterize', 'sketch',
+    'cartoon', 'anime', 'thermal', 'ice', 'ocean', 'plasma', 'jet',
+    'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring',
+    'summer', 'autumn', 'winter', 'rainbow', 'rainbow_shift', 'acid_trip',
+    'vhs', 'retro', 'cyberpunk', 'glow', 'solarize', 'edge_detect',
+    'halftone', 'red_tint', 'blue_tint', 'green_tint', 'neon_glow',
+    'pixelate', 'blur', 'sharpen', 'emboss'
+})
+
+# Face-region filters: applied to the detected face (or the center of the frame)
+FACE_FILTERS = frozenset({
+    'sam_reich'
+})
+
+ALL_FILTERS = tuple(sorted(ANIMATED_FILTERS | FULL_IMAGE_FILTERS | FACE_FILTERS))
+
+CATEGORY_ANIMATED = 'animated'
+CATEGORY_FULL_IMAGE = 'full_image'
+CATEGORY_FACE = 'face'
+
+# Anything not listed here is a face-region filter
+FILTER_CATEGORY = {
+    **{name: CATEGORY_ANIMATED for name in ANIMATED_FILTERS},
+    **{name: CATEGORY_FULL_IMAGE for name in FULL_IMAGE_FILTERS},
+}
+
+# Pixel-local filters whose NumPy temporaries (float32 copies, integer math) span the
+# whole frame; running them in row strips keeps input, temporaries and output in cache.
+# Pure cv2 filters gain nothing from this and are left whole.
+TILED_FILTERS = frozenset({
+    'sepia', 'negative', 'posterize'
+})
+TILE_ROWS = 64
+
+# Filters whose method doesn't follow the apply_<name> convention
+_METHOD_ALIASES = {'mirror': 'apply_mirror_split'}
+
+# Unbound FaceFilter methods resolved once at import; call as method(filter_app, frame, face, ...)
+FILTER_METHODS = {
+    name: getattr(FaceFilter, _METHOD_ALIASES.get(name, f'apply_{name}'))
+    for name in FILTER_CATEGORY
+}
+
+# Per-filter progress is buffered and flushed in batches; prompts that need the
+# user's attention (camera capture, usage) still go straight to stdout
+log = logging.getLogger('generate_comparison')
+LOG_BUFFER_CAPACITY = 16
+
+# Written and reused when --use-cached-frame is passed, to skip the camera warm-up on reruns
+CACHED_FRAME_PATH = '_cached_frame.png'
+
+# Per-worker state for --all mode, set once by the pool initializer
+_worker_frame = None
+_worker_frame_shm = None
+_worker_output_dir = None
+_worker_filter_app = None
+_worker_face = None
+_worker_faces = None
+
+# Comparison images are documentation previews; q85 is visually indistinguishable from
+# OpenCV's default q95 at roughly half the size and encode time
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+
+# Background JPEG encoder so filter work overlaps with imwrite
+_WRITE_QUEUE_SIZE = 2
+_write_queue = None
+_writer_thread = None
+
+# Free comparison canvases keyed by shape; a canvas returns here once it has been written
+_comparison_buffers = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _render_test_face() -> np.ndarray:
+    img = np.full((720, 1280, 3), 50, dtype=np.uint8)
     
     center_x, center_y = 640, 360
     face_width, face_height = 400, 500
@@ -29,16 +124,22 @@ def create_test_face_image():
     mouth_y = center_y + 120
     cv2.ellipse(img, (center_x, mouth_y), (60, 30), 0, 0, 180, (150, 100, 100), -1)
     
+    # Shared by every caller through the cache, so it must stay immutable
+    img.flags.writeable = False
     return img
 
 
-def capture_frame():
+def create_test_face_image():
+    return _render_test_face().copy()
+
+
+def _read_camera_frame() -> Optional[np.ndarray]:
     print("Attempting to capture from camera...")
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("Camera not available, using test image instead.")
         cap.release()
-        return create_test_face_image()
+        return None
     
     print("Capturing frame in 2 seconds... Look at the camera!")
     import time
@@ -49,88 +150,125 @@ def capture_frame():
     
     if not ret or frame is None:
         print("Could not capture frame, using test image instead.")
-        return create_test_face_image()
+        return None
     
     print("Frame captured successfully!")
     return frame
 
 
-def create_comparison(filter_type: str, original_frame: np.ndarray, output_path: str):
-    filter_app = FaceFilter()
-    filter_app.__enter__()
-    
-    animated_filters = {
-        'extreme_closeup', 'puzzle', 'fast_zoom_in', 'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom'
-    }
-    
-    full_image_filters = {
-        'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-        'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
-        'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
-        'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
-        'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
-        'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'rotate',
-        'rotate_45', 'rotate_90', 'flip_horizontal', 'flip_vertical',
-        'flip_both', 'quad_mirror', 'tile', 'radial_tile',
-        'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
-        'black_white', 'sepia', 'vintage', 'negative', 'posterize', 'sketch',
-        'cartoon', 'anime', 'thermal', 'ice', 'ocean', 'plasma', 'jet',
-        'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring',
-        'summer', 'autumn', 'winter', 'rainbow', 'rainbow_shift', 'acid_trip',
-        'vhs', 'retro', 'cyberpunk', 'glow', 'solarize', 'edge_detect',
-        'halftone', 'red_tint', 'blue_tint', 'green_tint', 'neon_glow',
-        'pixelate', 'blur', 'sharpen', 'emboss'
-    }
+def capture_frame():
+    frame = _read_camera_frame()
+    if frame is None:
+        return create_test_face_image()
+    return frame
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_face_mask_asset(filter_type: str) -> Optional[Tuple[str, str]]:
+    """Map '<folder>_face_mask_<name>' to (asset_dir, mask_name), or None if malformed."""
+    parts = filter_type.split('_')
+    if len(parts) < 3:
+        return None
+    folder = parts[0]
+    mask_name = parts[-1]
+    if folder == 'dropout':
+        asset_dir = 'assets/dropout/face_mask'
+    elif folder == 'assets':
+        asset_dir = 'assets/face_mask'
+    else:
+        asset_dir = f'assets/{folder}/face_mask'
+    return asset_dir, mask_name
+
+
+def load_frame(use_cached_frame: bool = False) -> Optional[np.ndarray]:
+    if use_cached_frame and os.path.exists(CACHED_FRAME_PATH):
+        frame = cv2.imread(CACHED_FRAME_PATH)
+        if frame is not None:
+            print(f"Using cached frame from {CACHED_FRAME_PATH}")
+            return frame
+    
+    frame = _read_camera_frame()
+    if frame is None:
+        # Don't cache the synthetic face, or a later run with a camera would keep reusing it
+        return create_test_face_image()
+    if use_cached_frame:
+        cv2.imwrite(CACHED_FRAME_PATH, frame)
+    return frame
+
+
+@functools.lru_cache(maxsize=4)
+def _comparison_chrome(h: int, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Render the BEFORE/AFTER labels and divider once per frame size.
+    
+    Returns the BGR layer and a boolean mask of the pixels it covers.
+    """
+    chrome = np.zeros((h, 2 * w, 3), dtype=np.uint8)
+    mask = np.zeros((h, 2 * w), dtype=np.uint8)
+    
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    font_scale = 1.5
+    thickness = 3
+    color = (255, 255, 255)
+    shadow_color = (0, 0, 0)
+    
+    text_y = 50
+    
+    for label, label_x in (('BEFORE', 30), ('AFTER', w + 30)):
+        cv2.putText(chrome, label, (label_x, text_y), font, font_scale, shadow_color, thickness + 2)
+        cv2.putText(chrome, label, (label_x, text_y), font, font_scale, color, thickness)
+        cv2.putText(mask, label, (label_x, text_y), font, font_scale, 255, thickness + 2)
+    
+    divider_x = w
+    cv2.line(chrome, (divider_x, 0), (divider_x, h), (255, 255, 255), 4)
+    cv2.line(mask, (divider_x, 0), (divider_x, h), 255, 4)
+    
+    chrome.flags.writeable = False
+    mask = (mask > 0)[:, :, np.newaxis]
+    mask.flags.writeable = False
+    return chrome, mask
+
+
+def _apply_tiled(filter_method, filter_app: FaceFilter, frame: np.ndarray) -> np.ndarray:
+    """Apply a pixel-local full-image filter in TILE_ROWS-high strips."""
+    w = frame.shape[1]
+    result = np.empty_like(frame)
+    for y0 in range(0, frame.shape[0], TILE_ROWS):
+        tile = frame[y0:y0 + TILE_ROWS]
+        result[y0:y0 + TILE_ROWS] = filter_method(filter_app, tile, (0, 0, w, tile.shape[0]))
+    return result
+
+
+def create_comparison(filter_type: str, original_frame: np.ndarray, output_path: str,
+                      filter_app: FaceFilter, face: Optional[Tuple[int, int, int, int]],
+                      faces: List[Tuple[int, int, int, int]]):
+    category = FILTER_CATEGORY.get(filter_type, CATEGORY_FACE)
     
     # Face mask filters are handled dynamically
     try:
         if 'face_mask' in filter_type:
-            # Parse filter name to extract folder and mask name
-            parts = filter_type.split('_')
-            if len(parts) >= 3:
-                folder = parts[0]
-                mask_name = parts[-1]
-                if folder == 'dropout':
-                    asset_dir = 'assets/dropout/face_mask'
-                elif folder == 'assets':
-                    asset_dir = 'assets/face_mask'
-                else:
-                    asset_dir = f'assets/{folder}/face_mask'
-                faces = filter_app.detect_all_faces(original_frame)
+            mask_asset = _resolve_face_mask_asset(filter_type)
+            if mask_asset:
+                asset_dir, mask_name = mask_asset
+                filtered_frame = original_frame
                 if faces:
-                    filtered_frame = original_frame.copy()
                     for face in faces:
-                        filtered_frame = filter_app.apply_face_mask_from_asset(filtered_frame.copy(), face, mask_name, asset_dir=asset_dir)
+                        filtered_frame = filter_app.apply_face_mask_from_asset(filtered_frame, face, mask_name, asset_dir=asset_dir)
                 else:
-                    print(f"Warning: No face detected for {filter_type} filter.")
-                    filtered_frame = original_frame.copy()
-            else:
-                filtered_frame = original_frame.copy()
-        elif filter_type in animated_filters:
-            dummy_face = (0, 0, original_frame.shape[1], original_frame.shape[0])
-            filter_method = getattr(filter_app, f'apply_{filter_type}', None)
-            if filter_method and callable(filter_method):
-                filtered_frame = filter_method(original_frame.copy(), dummy_face, 30)
+                    log.warning(f"Warning: No face detected for {filter_type} filter.")
             else:
-                print(f"Error: Filter method not found for {filter_type}")
-                filter_app.__exit__(None, None, None)
-                return False
-        elif filter_type in full_image_filters:
+                filtered_frame = original_frame
+        elif category == CATEGORY_ANIMATED:
             dummy_face = (0, 0, original_frame.shape[1], original_frame.shape[0])
-            if filter_type == 'mirror':
-                filter_method = filter_app.apply_mirror_split
-            else:
-                filter_method = getattr(filter_app, f'apply_{filter_type}', None)
-            if filter_method and callable(filter_method):
-                filtered_frame = filter_method(original_frame.copy(), dummy_face)
+            filtered_frame = FILTER_METHODS[filter_type](filter_app, original_frame, dummy_face, 30)
+        elif category == CATEGORY_FULL_IMAGE:
+            if filter_type in TILED_FILTERS:
+                filtered_frame = _apply_tiled(FILTER_METHODS[filter_type], filter_app, original_frame)
             else:
-                print(f"Error: Filter method not found for {filter_type}")
-                filter_app.__exit__(None, None, None)
-                return False
+                dummy_face = (0, 0, original_frame.shape[1], original_frame.shape[0])
+                filtered_frame = FILTER_METHODS[filter_type](filter_app, original_frame, dummy_face)
         else:
-            face = filter_app.detect_face(original_frame)
             if not face:
-                print("Warning: No face detected. Applying filter to center region.")
+                log.warning("Warning: No face detected. Applying filter to center region.")
                 h, w = original_frame.shape[:2]
                 center_x, center_y = w // 2, h // 2
                 face_size = min(w, h) // 3
@@ -138,113 +276,247 @@ def create_comparison(filter_type: str, original_frame: np.ndarray, output_path:
             
             filter_method = getattr(filter_app, f'apply_{filter_type}', None)
             if filter_method and callable(filter_method):
-                filtered_frame = filter_method(original_frame.copy(), face)
+                filtered_frame = filter_method(original_frame, face)
             else:
-                print(f"Error: Filter method not found for {filter_type}")
-                filter_app.__exit__(None, None, None)
+                log.error(f"Error: Filter method not found for {filter_type}")
                 return False
     except Exception as e:
-        print(f"Error applying filter {filter_type}: {e}")
-        filter_app.__exit__(None, None, None)
+        log.error(f"Error applying filter {filter_type}: {e}")
         return False
     
-    filter_app.__exit__(None, None, None)
-    
     h, w = original_frame.shape[:2]
     
-    comparison = np.hstack([original_frame, filtered_frame])
+    comparison = _acquire_comparison_buffer((h, 2 * w, 3))
+    comparison[:, :w] = original_frame
+    comparison[:, w:] = filtered_frame
     
     font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 1.5
-    thickness = 3
-    color = (255, 255, 255)
     shadow_color = (0, 0, 0)
     
-    text_y = 50
-    
-    cv2.putText(comparison, 'BEFORE', (30, text_y), font, font_scale, shadow_color, thickness + 2)
-    cv2.putText(comparison, 'BEFORE', (30, text_y), font, font_scale, color, thickness)
-    
-    cv2.putText(comparison, 'AFTER', (w + 30, text_y), font, font_scale, shadow_color, thickness + 2)
-    cv2.putText(comparison, 'AFTER', (w + 30, text_y), font, font_scale, color, thickness)
-    
     filter_text = f'{filter_type.upper()} FILTER'
     text_size = cv2.getTextSize(filter_text, font, 1.2, 2)[0]
     text_x = (comparison.shape[1] - text_size[0]) // 2
     cv2.putText(comparison, filter_text, (text_x, h - 30), font, 1.2, shadow_color, 3)
     cv2.putText(comparison, filter_text, (text_x, h - 30), font, 1.2, (0, 255, 255), 2)
     
-    divider_x = w
-    cv2.line(comparison, (divider_x, 0), (divider_x, h), (255, 255, 255), 4)
+    # Labels and divider go on last, so the divider still crosses the title
+    chrome, chrome_mask = _comparison_chrome(h, w)
+    np.copyto(comparison, chrome, where=chrome_mask)
     
-    cv2.imwrite(output_path, comparison)
-    print(f"Comparison image saved to: {output_path}")
+    _save_comparison(output_path, comparison)
     return True
 
 
+def _image_writer(write_queue: queue.Queue):
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        try:
+            _write_comparison(*item)
+        except Exception as e:
+            # Keep draining: a dead writer would leave _save_comparison blocked on a full queue
+            log.error(f"Error saving comparison image {item[0]}: {e}")
+
+
+def start_image_writer():
+    global _write_queue, _writer_thread
+    if _writer_thread is not None:
+        return
+    _write_queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+    _writer_thread = threading.Thread(target=_image_writer, args=(_write_queue,), daemon=True)
+    _writer_thread.start()
+
+
+def stop_image_writer():
+    """Flush pending writes and stop the writer thread."""
+    global _write_queue, _writer_thread
+    if _writer_thread is None:
+        return
+    _write_queue.put(None)
+    _writer_thread.join()
+    _write_queue = None
+    _writer_thread = None
+
+
+def _write_comparison(output_path: str, comparison: np.ndarray):
+    try:
+        if cv2.imwrite(output_path, comparison, JPEG_PARAMS):
+            log.info(f"Comparison image saved to: {output_path}")
+        else:
+            log.error(f"Error: Could not write comparison image to {output_path}")
+    finally:
+        _release_comparison_buffer(comparison)
+
+
+def _save_comparison(output_path: str, comparison: np.ndarray):
+    if _write_queue is not None:
+        _write_queue.put((output_path, comparison))
+    else:
+        _write_comparison(output_path, comparison)
+
+
+def _acquire_comparison_buffer(shape: Tuple[int, int, int]) -> np.ndarray:
+    free = _comparison_buffers.setdefault(shape, queue.Queue())
+    try:
+        return free.get_nowait()
+    except queue.Empty:
+        # Only grows to the number of canvases in flight (queued + being written + being drawn)
+        return np.empty(shape, dtype=np.uint8)
+
+
+def _release_comparison_buffer(comparison: np.ndarray):
+    _comparison_buffers[comparison.shape].put(comparison)
+
+
 def get_all_filters():
-    return [
-        'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-        'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple',
-        'radial_blur', 'cylinder', 'barrel', 'pincushion', 'whirlpool',
-        'radial_zoom', 'concave', 'convex', 'spiral', 'radial_stretch',
-        'radial_compress', 'vertical_wave', 'horizontal_wave', 'skew_horizontal',
-        'skew_vertical', 'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out',
-        'fast_zoom_in', 'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom',
-        'extreme_closeup', 'puzzle', 'rotate', 'rotate_45', 'rotate_90',
-        'flip_horizontal', 'flip_vertical', 'flip_both', 'quad_mirror', 'tile',
-        'radial_tile', 'zoom_blur', 'melt', 'kaleidoscope', 'glitch',
-        'double_vision', 'sam_reich', 'black_white', 'sepia', 'vintage',
-        'neon_glow', 'pixelate', 'blur', 'sharpen', 'emboss', 'red_tint',
-        'blue_tint', 'green_tint', 'rainbow', 'negative', 'posterize', 'sketch',
-        'cartoon', 'thermal', 'ice', 'ocean', 'plasma', 'jet', 'turbo',
-        'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring', 'summer',
-        'autumn', 'winter', 'rainbow_shift', 'acid_trip', 'vhs', 'retro',
-        'cyberpunk', 'anime', 'glow', 'solarize', 'edge_detect', 'halftone',
-    ]
+    return ALL_FILTERS
+
+
+def configure_logging():
+    if log.handlers:
+        return
+    handler = logging.handlers.MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=logging.StreamHandler(sys.stdout)
+    )
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def flush_logging():
+    for handler in log.handlers:
+        handler.flush()
+
+
+def _init_worker(frame_spec: Tuple[str, Tuple[int, ...], str], output_dir: str,
+                 face: Optional[Tuple[int, int, int, int]], faces: List[Tuple[int, int, int, int]]):
+    global _worker_frame, _worker_frame_shm, _worker_output_dir, _worker_filter_app, _worker_face, _worker_faces
+    # Each worker already owns a core; keep OpenCV from spawning its own threads on top
+    cv2.setNumThreads(1)
+    # Attach to the parent's shared frame instead of receiving a pickled copy
+    shm_name, shape, dtype = frame_spec
+    _worker_frame_shm = shared_memory.SharedMemory(name=shm_name)
+    frame = np.ndarray(shape, dtype=dtype, buffer=_worker_frame_shm.buf)
+    # Filters return new images; the shared frame must never be written to
+    frame.flags.writeable = False
+    _worker_frame = frame
+    _worker_output_dir = output_dir
+    _worker_filter_app = FaceFilter()
+    _worker_face = face
+    _worker_faces = faces
+    configure_logging()
+    start_image_writer()
+    # Pool workers exit through multiprocessing's finalizers, not atexit.
+    # Higher priority runs first: drain the writer, then flush what it logged.
+    mp_util.Finalize(None, stop_image_writer, exitpriority=10)
+    mp_util.Finalize(None, flush_logging, exitpriority=5)
+
+
+def _generate_comparison_worker(filter_type: str) -> bool:
+    output_path = os.path.join(_worker_output_dir, f"comparison_{filter_type}.jpg")
+    log.info(f"\nProcessing {filter_type}...")
+    return create_comparison(filter_type, _worker_frame, output_path,
+                             _worker_filter_app, _worker_face, _worker_faces)
+
+
+def run_server(use_cached_frame: bool = False):
+    """Serve comparison requests from stdin, one '<filter-type> [output-path]' per line.
+    
+    The frame, FaceFilter and face detection are set up once, so each request
+    only pays for the filter itself.
+    """
+    frame = load_frame(use_cached_frame)
+    if frame is None:
+        sys.exit(1)
+    frame.flags.writeable = False
+    
+    filter_app = FaceFilter()
+    face = filter_app.detect_face(frame)
+    faces = filter_app.detect_all_faces(frame)
+    
+    print("Ready. Enter a filter name per line (Ctrl+D to quit).", flush=True)
+    for line in sys.stdin:
+        request = line.split()
+        if not request:
+            continue
+        filter_type = request[0].lower()
+        output_path = request[1] if len(request) > 1 else f"comparison_{filter_type}.jpg"
+        create_comparison(filter_type, frame, output_path, filter_app, face, faces)
+        flush_logging()
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3.11 generate_comparison.py <filter-type> [output-path]")
-        print("Or: python3.11 generate_comparison.py --all")
+    configure_logging()
+    use_cached_frame = '--use-cached-frame' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--use-cached-frame']
+    
+    if len(args) < 1:
+        print("Usage: python3.11 generate_comparison.py <filter-type> [output-path] [--use-cached-frame]")
+        print("Or: python3.11 generate_comparison.py --all [--use-cached-frame]")
+        print("Or: python3.11 generate_comparison.py --server [--use-cached-frame]")
         print("Available filters: (use --all to see full list)")
         sys.exit(1)
     
-    if sys.argv[1] == '--all':
+    if args[0] == '--server':
+        run_server(use_cached_frame)
+        return
+    
+    if args[0] == '--all':
         all_filters = get_all_filters()
         print(f"Generating comparison images for all {len(all_filters)} filters...")
-        frame = capture_frame()
+        frame = load_frame(use_cached_frame)
         if frame is None:
             sys.exit(1)
         
         output_dir = "docs"
         os.makedirs(output_dir, exist_ok=True)
         
+        # Detect once on the shared frame; every filter sees the same faces
+        filter_app = FaceFilter()
+        face = filter_app.detect_face(frame)
+        faces = filter_app.detect_all_faces(frame)
+        
         success_count = 0
-        for filter_type in all_filters:
-            output_path = os.path.join(output_dir, f"comparison_{filter_type}.jpg")
-            print(f"\nProcessing {filter_type}...")
-            if create_comparison(filter_type, frame, output_path):
-                success_count += 1
+        # Unwinds in reverse: pool, then the shared frame, on success or error alike
+        with contextlib.ExitStack() as stack:
+            frame_shm = shared_memory.SharedMemory(create=True, size=frame.nbytes)
+            stack.callback(frame_shm.unlink)
+            stack.callback(frame_shm.close)
+            shared_frame = np.ndarray(frame.shape, dtype=frame.dtype, buffer=frame_shm.buf)
+            shared_frame[:] = frame
+            del shared_frame  # the buffer can't be closed while a view still exports it
+            frame_spec = (frame_shm.name, frame.shape, frame.dtype.str)
+            pool = stack.enter_context(
+                multiprocessing.Pool(initializer=_init_worker, initargs=(frame_spec, output_dir, face, faces))
+            )
+            for ok in pool.imap_unordered(_generate_comparison_worker, all_filters):
+                success_count += ok
+            # close/join (rather than the implicit terminate) lets workers flush queued writes
+            pool.close()
+            pool.join()
         
-        print(f"\n\nSuccessfully generated {success_count}/{len(all_filters)} comparison images in {output_dir}/")
+        log.info(f"\n\nSuccessfully generated {success_count}/{len(all_filters)} comparison images in {output_dir}/")
         return
     
-    filter_type = sys.argv[1].lower()
-    output_path = sys.argv[2] if len(sys.argv) > 2 else f"comparison_{filter_type}.jpg"
+    filter_type = args[0].lower()
+    output_path = args[1] if len(args) > 1 else f"comparison_{filter_type}.jpg"
     
     print(f"Generating comparison for filter: {filter_type}")
     
-    frame = capture_frame()
+    frame = load_frame(use_cached_frame)
     if frame is None:
         sys.exit(1)
     
-    success = create_comparison(filter_type, frame, output_path)
+    filter_app = FaceFilter()
+    face = filter_app.detect_face(frame)
+    faces = filter_app.detect_all_faces(frame)
+    
+    success = create_comparison(filter_type, frame, output_path, filter_app, face, faces)
     if not success:
         sys.exit(1)
     
-    print(f"\nSuccess! View the comparison at: {output_path}")
+    log.info(f"\nSuccess! View the comparison at: {output_path}")
 
 
 if __name__ == '__main__':
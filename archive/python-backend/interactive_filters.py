@@ -5,9 +5,13 @@ import json
 import os
 import time
 import threading
+import queue
+import functools
+import types
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from face_filters import FaceFilter
-from typing import Tuple, Optional, List, Dict
+from typing import Tuple, Optional, List, Dict, Callable
 try:
     from update_checker import UpdateChecker
     UPDATE_CHECKER_AVAILABLE = True
@@ -30,6 +34,142 @@ except ImportError:
             def log_performance(self, *args, **kwargs): pass
         return DummyLogger()
 
+# path -> (mtime, parsed JSON); config and theme files are re-read only after they change
+_json_cache: Dict[str, Tuple[float, object]] = {}
+
+
+def _load_json_cached(path: str):
+    """Parse a JSON file, reusing the previous parse while its mtime is unchanged.
+    
+    Returns None if the file does not exist; parse errors propagate.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r') as f:
+        data = json.load(f)
+    _json_cache[path] = (mtime, data)
+    return data
+
+
+ANIMATED_FILTERS = frozenset({
+    'extreme_closeup', 'puzzle', 'fast_zoom_in', 'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom'
+})
+
+FULL_IMAGE_FILTERS = frozenset({
+    'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
+    'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
+    'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
+    'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
+    'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
+    'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'rotate',
+    'rotate_45', 'rotate_90', 'flip_horizontal', 'flip_vertical',
+    'flip_both', 'quad_mirror', 'tile', 'radial_tile',
+    'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
+    'black_white', 'sepia', 'vintage', 'negative', 'posterize', 'sketch',
+    'cartoon', 'anime', 'thermal', 'ice', 'ocean', 'plasma', 'jet',
+    'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring',
+    'summer', 'autumn', 'winter', 'rainbow', 'rainbow_shift', 'acid_trip',
+    'vhs', 'retro', 'cyberpunk', 'glow', 'solarize', 'edge_detect',
+    'halftone', 'red_tint', 'blue_tint', 'green_tint', 'neon_glow',
+    'pixelate', 'blur', 'sharpen', 'emboss'
+})
+
+# Filters whose FaceFilter method isn't simply apply_<filter>
+FILTER_METHOD_ALIASES = {'mirror': 'apply_mirror_split'}
+
+FILTER_CATEGORIES = types.MappingProxyType({
+    'DROPOUT': (),  # Face masks are discovered dynamically
+    'Distortion': (
+        'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
+        'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
+        'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
+        'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
+        'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
+        'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'fast_zoom_in',
+        'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom', 'extreme_closeup',
+        'puzzle', 'rotate', 'rotate_45', 'rotate_90', 'flip_horizontal',
+        'flip_vertical', 'flip_both', 'quad_mirror', 'tile', 'radial_tile',
+        'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision'
+    ),
+    'Color & Style': (
+        'black_white', 'sepia', 'vintage', 'neon_glow', 'pixelate', 'blur',
+        'sharpen', 'emboss', 'red_tint', 'blue_tint', 'green_tint', 'rainbow',
+        'negative', 'posterize', 'sketch', 'cartoon', 'thermal', 'ice', 'ocean',
+        'plasma', 'jet', 'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot',
+        'spring', 'summer', 'autumn', 'winter', 'rainbow_shift', 'acid_trip',
+        'vhs', 'retro', 'cyberpunk', 'anime', 'glow', 'solarize', 'edge_detect', 'halftone'
+    )
+})
+
+# Flat filter list (None/Original first), built once from the categories
+FILTER_LIST = ((None, 'None (Original)'),) + tuple(
+    (filter_type, filter_type.replace('_', ' ').title())
+    for filters in FILTER_CATEGORIES.values()
+    for filter_type in filters
+)
+FILTER_ENTRIES = types.MappingProxyType({ft: (ft, name) for ft, name in FILTER_LIST if ft is not None})
+FILTER_POSITIONS = types.MappingProxyType({ft: i for i, (ft, _) in enumerate(FILTER_LIST)})
+CATEGORIZED_FILTERS = types.MappingProxyType({
+    category: tuple(FILTER_ENTRIES[ft] for ft in filter_types if ft in FILTER_ENTRIES)
+    for category, filter_types in FILTER_CATEGORIES.items()
+})
+# Number keys: 0 is None (Original), 1-7 the first filters after it
+DIGIT_QUICK_ACCESS = types.MappingProxyType({str(i): FILTER_LIST[i] for i in range(min(8, len(FILTER_LIST)))})
+# Lowercased search haystack per filter: name, filter type, and name with underscores,
+# joined by a separator a typed query can't contain so one substring test covers all three
+SEARCH_INDEX = tuple(
+    (filter_type, name, '\0'.join((name.lower(), filter_type.lower() if filter_type else '',
+                                    name.lower().replace(' ', '_'))))
+    for filter_type, name in FILTER_LIST
+)
+SEARCH_HAYSTACKS = types.MappingProxyType({ft: haystack for ft, _, haystack in SEARCH_INDEX})
+# Key code -> lowercased character it types into the search box ('' if none)
+SEARCH_KEY_CHARS = tuple(
+    chr(code).lower() if code < 128 and (chr(code).isalnum() or chr(code) in ' _-') else ''
+    for code in range(256)
+)
+
+
+def hex_to_rgb(hex_str) -> List[int]:
+    hex_str = str(hex_str).lstrip('#')
+    if len(hex_str) == 6:
+        # One C-level parse; raises ValueError on bad digits, like int(..., 16) did
+        rgb = bytes.fromhex(hex_str)
+        if len(rgb) == 3:  # fromhex skips embedded spaces
+            return list(rgb)
+    return [128, 128, 128]
+
+
+def tint_roi(roi: np.ndarray, color, alpha: float):
+    """Blend a solid BGR color over roi in place: roi * (1 - alpha) + color * alpha"""
+    # One fused per-pixel affine pass; no full-size color image is allocated
+    m = np.zeros((3, 4))
+    np.fill_diagonal(m, 1 - alpha)
+    m[:, 3] = np.multiply(color, alpha)
+    cv2.transform(roi, m, dst=roi)
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_face_mask_asset(filter_type: str) -> Optional[Tuple[str, str]]:
+    """Map '<folder>_face_mask_<name>' to (asset_dir, mask_name), or None if malformed"""
+    parts = filter_type.split('_')
+    if len(parts) < 3:
+        return None
+    folder = parts[0]
+    mask_name = parts[-1]
+    if folder == 'dropout':
+        asset_dir = 'assets/dropout/face_mask'
+    elif folder == 'assets':
+        asset_dir = 'assets/face_mask'
+    else:
+        asset_dir = f'assets/{folder}/face_mask'
+    return asset_dir, mask_name
+
 
 class InteractiveFilterViewer:
     def __init__(self, width: int = 1280, height: int = 720, fps: int = 30):
@@ -37,7 +177,11 @@ class InteractiveFilterViewer:
         self.height = height
         self.fps = fps
         self.cap = None
+        self.latest_frame = queue.Queue(maxsize=1)  # newest (ok, frame) from the capture thread
+        self.capture_stop = threading.Event()
+        self.capture_thread = None
         self.filter_app = None
+        self.filter_dispatch = {}
         self.auto_advance = False
         self.last_advance_time = 0
         self.window_name = 'WesWorld FX'
@@ -56,18 +200,27 @@ class InteractiveFilterViewer:
         self.update_checker = None
         self.update_available = False
         self.update_info = None
-        self.last_update_check = 0
+        self.last_update_check = float('-inf')  # monotonic time of the last check
         self.update_check_interval = 300  # 5 minutes
+        self.update_check_requested = threading.Event()  # wakes the update thread for a manual check
+        self.update_pull_requested = threading.Event()  # 'U' with an update pending: pull on the update thread
+        self.update_stop = threading.Event()
         
         # Favorites/presets
         self.favorites = self.load_favorites()
         self.recording = False
         self.video_writer = None
         self.recording_path = None
+        self.recording_queue = None
+        self.recording_buffers = None
+        self.recording_thread = None
+        self.recording_dropped = 0
         
         # Performance optimization
         self.frame_cache = None
         self.cache_valid = False
+        self.face_cache_frame = None  # frame the cached detections belong to
+        self.face_cache = {}
         
         # Camera selection
         self.available_cameras = []
@@ -77,39 +230,14 @@ class InteractiveFilterViewer:
         self.theme_name = self.load_config().get('theme', 'wesworld')
         self.available_themes = ['wesworld', 'dropout', 'default']
         self.theme = self.load_theme()
+        self.theme_bgr = self.build_theme_bgr(self.theme)
         
         # Filter categories (matching web UI)
-        self.filter_categories = {
-            'DROPOUT': [],  # Face masks are discovered dynamically
-            'Distortion': [
-                'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-                'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
-                'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
-                'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
-                'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
-                'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'fast_zoom_in',
-                'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom', 'extreme_closeup',
-                'puzzle', 'rotate', 'rotate_45', 'rotate_90', 'flip_horizontal',
-                'flip_vertical', 'flip_both', 'quad_mirror', 'tile', 'radial_tile',
-                'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision'
-            ],
-            'Color & Style': [
-                'black_white', 'sepia', 'vintage', 'neon_glow', 'pixelate', 'blur',
-                'sharpen', 'emboss', 'red_tint', 'blue_tint', 'green_tint', 'rainbow',
-                'negative', 'posterize', 'sketch', 'cartoon', 'thermal', 'ice', 'ocean',
-                'plasma', 'jet', 'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot',
-                'spring', 'summer', 'autumn', 'winter', 'rainbow_shift', 'acid_trip',
-                'vhs', 'retro', 'cyberpunk', 'anime', 'glow', 'solarize', 'edge_detect', 'halftone'
-            ]
-        }
-        
-        # Build flat filter list from categories
-        self.filter_list = [(None, 'None (Original)')]
-        for category, filters in self.filter_categories.items():
-            for filter_type in filters:
-                # Find display name
-                display_name = filter_type.replace('_', ' ').title()
-                self.filter_list.append((filter_type, display_name))
+        self.filter_categories = FILTER_CATEGORIES
+        self.filter_list = FILTER_LIST
+        self.filter_entries = FILTER_ENTRIES
+        self.filter_positions = FILTER_POSITIONS
+        self.categorized_filters = CATEGORIZED_FILTERS
         
         # Initialize current filter (None/Original is first)
         self.current_filter_index = 0
@@ -117,20 +245,25 @@ class InteractiveFilterViewer:
         self.current_filter_name = self.filter_list[0][1]
         
         # Setup quick access filters
-        self.filters = {
-            '0': self.filter_list[0],  # None (Original)
-        }
-        # Add number keys for first few filters after None
-        for i in range(1, 8):
-            if i < len(self.filter_list):
-                self.filters[str(i)] = self.filter_list[i]
+        self.filters = DIGIT_QUICK_ACCESS
+        self.key_handlers = self.build_key_handlers()
         
         # Search functionality (works continuously like web UI)
-        self.search_query = ''
+        self.search_query = ''  # Always lowercase: typed characters come from SEARCH_KEY_CHARS
         self.search_buffer = ''  # For building search query
         self.search_active = False  # Whether we're currently typing search
         self.last_search_key_time = 0
         self.search_timeout = 2.0  # Clear search after 2 seconds of no input
+        self.search_debounce = 0.08  # Report results once typing pauses this long
+        self.search_pending = False
+        self.search_index = SEARCH_INDEX
+        self.search_haystacks = SEARCH_HAYSTACKS
+        self.search_cache_favorites = None
+        self.search_cache = {}  # lowercased query -> matching (filter_type, name) list
+        self.panel_sprite_key = None
+        self.panel_sprite = None
+        self.status_sprite_key = None
+        self.status_sprite = None
         
         # Logger
         self.logger = get_logger("interactive", "logs")
@@ -153,15 +286,15 @@ class InteractiveFilterViewer:
             return str(index - 1)
     
     def load_config(self) -> dict:
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                pass
-        return {}
+        try:
+            config = _load_json_cached(self.config_path)
+        except (json.JSONDecodeError, ValueError):
+            config = None
+        # Callers modify and save the result; hand out a copy so the cache stays clean
+        return dict(config) if config else {}
     
     def save_config(self, config: dict):
+        _json_cache.pop(self.config_path, None)
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(config, f, indent=2)
@@ -219,39 +352,34 @@ class InteractiveFilterViewer:
         """Load theme configuration matching HTML themes"""
         theme_path = os.path.join(os.path.dirname(__file__), 'themes', f'{self.theme_name}.json')
         
-        def hex_to_rgb(hex_str):
-            hex_str = str(hex_str).lstrip('#')
-            if len(hex_str) == 6:
-                return [int(hex_str[i:i+2], 16) for i in (0, 2, 4)]
-            return [128, 128, 128]
-        
-        if os.path.exists(theme_path):
+        try:
+            theme_data = _load_json_cached(theme_path)
+        except (json.JSONDecodeError, ValueError):
+            theme_data = None
+        if theme_data and 'colors' in theme_data:
             try:
-                with open(theme_path, 'r') as f:
-                    theme_data = json.load(f)
-                    if 'colors' in theme_data:
-                        colors = theme_data['colors']
-                        return {
-                            'background': hex_to_rgb(colors.get('background', '#000000')),
-                            'surface': hex_to_rgb(colors.get('surface', '#1a1a1a')),
-                            'surfaceHover': hex_to_rgb(colors.get('surfaceHover', '#2a2a2a')),
-                            'text': hex_to_rgb(colors.get('text', '#ffffff')),
-                            'textSecondary': hex_to_rgb(colors.get('textSecondary', '#cccccc')),
-                            'accent': hex_to_rgb(colors.get('accent', '#5250ef')),
-                            'accentHover': hex_to_rgb(colors.get('accentHover', '#6260ff')),
-                            'border': hex_to_rgb(colors.get('border', '#333333')),
-                            'borderHover': hex_to_rgb(colors.get('borderHover', '#5250ef')),
-                            'button': hex_to_rgb(colors.get('button', '#5250ef')),
-                            'buttonHover': hex_to_rgb(colors.get('buttonHover', '#6260ff')),
-                            'statusConnected': hex_to_rgb(colors.get('statusConnected', '#4caf50')),
-                            'statusError': hex_to_rgb(colors.get('statusError', '#f44336')),
-                            'groupTitle': hex_to_rgb(colors.get('groupTitle', '#5250ef')),
-                            'selectedText': hex_to_rgb(colors.get('selectedText', '#ffffff')),
-                            'bg_alpha': 0.95,
-                            'recording_color': [0, 255, 0],
-                            'update_color': [255, 200, 0]
-                        }
-            except (json.JSONDecodeError, ValueError, KeyError):
+                colors = theme_data['colors']
+                return {
+                    'background': hex_to_rgb(colors.get('background', '#000000')),
+                    'surface': hex_to_rgb(colors.get('surface', '#1a1a1a')),
+                    'surfaceHover': hex_to_rgb(colors.get('surfaceHover', '#2a2a2a')),
+                    'text': hex_to_rgb(colors.get('text', '#ffffff')),
+                    'textSecondary': hex_to_rgb(colors.get('textSecondary', '#cccccc')),
+                    'accent': hex_to_rgb(colors.get('accent', '#5250ef')),
+                    'accentHover': hex_to_rgb(colors.get('accentHover', '#6260ff')),
+                    'border': hex_to_rgb(colors.get('border', '#333333')),
+                    'borderHover': hex_to_rgb(colors.get('borderHover', '#5250ef')),
+                    'button': hex_to_rgb(colors.get('button', '#5250ef')),
+                    'buttonHover': hex_to_rgb(colors.get('buttonHover', '#6260ff')),
+                    'statusConnected': hex_to_rgb(colors.get('statusConnected', '#4caf50')),
+                    'statusError': hex_to_rgb(colors.get('statusError', '#f44336')),
+                    'groupTitle': hex_to_rgb(colors.get('groupTitle', '#5250ef')),
+                    'selectedText': hex_to_rgb(colors.get('selectedText', '#ffffff')),
+                    'bg_alpha': 0.95,
+                    'recording_color': [0, 255, 0],
+                    'update_color': [255, 200, 0]
+                }
+            except (ValueError, KeyError):
                 pass
         
         # Default themes (matching HTML)
@@ -298,11 +426,20 @@ class InteractiveFilterViewer:
                 'update_color': [255, 200, 0]
             }
     
+    @staticmethod
+    def build_theme_bgr(theme: Dict) -> types.SimpleNamespace:
+        """Convert theme colors (RGB lists, as in the HTML themes) to the BGR tuples OpenCV draws with"""
+        return types.SimpleNamespace(**{
+            key: tuple(value[::-1]) if isinstance(value, list) else value
+            for key, value in theme.items()
+        })
+    
     def switch_theme(self, theme_name: str):
         """Switch theme"""
         if theme_name in self.available_themes:
             self.theme_name = theme_name
             self.theme = self.load_theme()
+            self.theme_bgr = self.build_theme_bgr(self.theme)
             config = self.load_config()
             config['theme'] = theme_name
             self.save_config(config)
@@ -311,60 +448,103 @@ class InteractiveFilterViewer:
     
     def get_filters_by_category(self) -> Dict[str, List[Tuple[Optional[str], str]]]:
         """Get filters organized by category"""
-        categorized = {}
-        for category, filter_types in self.filter_categories.items():
-            categorized[category] = []
-            for filter_type in filter_types:
-                # Find in filter_list
-                for ft, name in self.filter_list:
-                    if ft == filter_type:
-                        categorized[category].append((ft, name))
-                        break
-        return categorized
+        return self.categorized_filters
     
     def get_filtered_filters(self) -> Optional[List[Tuple[Optional[str], str]]]:
         """Get filtered filters based on search query (matches web UI behavior)"""
         if not self.search_query:
             return None
         
-        search_lower = self.search_query.lower().strip()
+        search_lower = self.search_query.strip()
         if not search_lower:
             return None
         
-        filtered = []
-        for filter_type, name in self.filter_list:
-            # Skip if pinned (pinned items shown separately in web UI)
-            if filter_type and filter_type in self.favorites:
-                continue
-            
-            # Match against name, filter type, or formatted name
-            name_lower = name.lower()
-            type_lower = filter_type.lower() if filter_type else ''
-            
-            if (search_lower in name_lower or 
-                search_lower in type_lower or
-                search_lower in name_lower.replace(' ', '_')):
-                filtered.append((filter_type, name))
-        
+        # Results are cached per query for the current favorites
+        favorites = tuple(self.favorites)
+        if favorites != self.search_cache_favorites or len(self.search_cache) >= 64:
+            self.search_cache.clear()
+            self.search_cache_favorites = favorites
+        filtered = self.search_cache.get(search_lower)
+        if filtered is None:
+            # A query's matches are a subset of any cached prefix's, so typing forward
+            # only rescans the previous keystroke's results
+            prefix = max((q for q in self.search_cache if search_lower.startswith(q)), key=len, default=None)
+            if prefix is not None:
+                filtered = [entry for entry in self.search_cache[prefix]
+                            if search_lower in self.search_haystacks[entry[0]]]
+            else:
+                pinned = set(favorites)
+                filtered = [
+                    (filter_type, name) for filter_type, name, haystack in self.search_index
+                    # Skip if pinned (pinned items shown separately in web UI)
+                    if not (filter_type and filter_type in pinned)
+                    # Match against name, filter type, or formatted name
+                    and search_lower in haystack
+                ]
+            self.search_cache[search_lower] = filtered
         return filtered if filtered else None
     
+    def open_camera(self, index: int) -> cv2.VideoCapture:
+        """Open a camera, preferring AVFoundation on macOS so buffer size is honored"""
+        if sys.platform == 'darwin':
+            return cv2.VideoCapture(index, cv2.CAP_AVFOUNDATION)
+        return cv2.VideoCapture(index)
+    
+    def probe_camera(self, index: int) -> Optional[Tuple[int, str]]:
+        """Return (index, name) if a camera opens at index, else None"""
+        cap = self.open_camera(index)
+        if not cap.isOpened():
+            return None
+        # Try to get camera name (may not work on all systems)
+        name = f"Camera {index}"
+        try:
+            # Some systems support getting camera name
+            backend = cap.getBackendName()
+            name = f"Camera {index} ({backend})"
+        except:
+            pass
+        cap.release()
+        return (index, name)
+    
     def get_available_cameras(self) -> List[Tuple[int, str]]:
         """Get list of available cameras"""
-        cameras = []
-        for i in range(10):  # Check up to 10 cameras
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                # Try to get camera name (may not work on all systems)
-                name = f"Camera {i}"
-                try:
-                    # Some systems support getting camera name
-                    backend = cap.getBackendName()
-                    name = f"Camera {i} ({backend})"
-                except:
-                    pass
-                cameras.append((i, name))
-                cap.release()
-        return cameras
+        # Each probe mostly waits on the driver with the GIL released, so probe all at once
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = executor.map(self.probe_camera, range(10))  # Check up to 10 cameras
+        return [camera for camera in results if camera is not None]
+    
+    def capture_loop(self):
+        """Read camera frames continuously, keeping only the newest for the render loop"""
+        # cv2 releases the GIL while it waits on and decodes a frame, so capture overlaps
+        # with filtering instead of adding to it, and the driver queue never backs up
+        while not self.capture_stop.is_set():
+            ret, frame = self.cap.read()
+            try:
+                self.latest_frame.get_nowait()
+            except queue.Empty:
+                pass
+            self.latest_frame.put((ret, frame))
+            if not ret:
+                time.sleep(0.1)
+    
+    def start_capture(self):
+        if self.capture_thread is None:
+            self.capture_stop.clear()
+            self.capture_thread = threading.Thread(target=self.capture_loop, daemon=True)
+            self.capture_thread.start()
+    
+    def stop_capture(self):
+        if self.capture_thread is not None:
+            self.capture_stop.set()
+            self.capture_thread.join(timeout=2.0)
+            self.capture_thread = None
+    
+    def read_latest_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Wait for the next frame from the capture thread"""
+        try:
+            return self.latest_frame.get(timeout=1.0)
+        except queue.Empty:
+            return False, None
     
     def start_recording(self, output_path: Optional[str] = None):
         """Start recording video"""
@@ -388,6 +568,17 @@ class InteractiveFilterViewer:
         if self.video_writer.isOpened():
             self.recording = True
             self.recording_path = output_path
+            # Encoding runs on its own thread; a short queue absorbs encoder hiccups
+            self.recording_queue = queue.Queue(maxsize=8)
+            # Free list of frame buffers; only grows to the number of frames in flight
+            self.recording_buffers = queue.Queue()
+            self.recording_dropped = 0
+            self.recording_thread = threading.Thread(
+                target=self.recording_writer,
+                args=(self.video_writer, self.recording_queue, self.recording_buffers),
+                daemon=True
+            )
+            self.recording_thread.start()
             self.logger.log_event("recording_started", {"path": output_path})
             print(f"Recording started: {output_path}")
         else:
@@ -395,11 +586,47 @@ class InteractiveFilterViewer:
             print("Failed to start recording")
             self.video_writer = None
     
+    def recording_writer(self, video_writer: cv2.VideoWriter, frames: queue.Queue, buffers: queue.Queue):
+        """Encode queued frames until a None sentinel arrives, recycling their buffers"""
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            video_writer.write(frame)
+            buffers.put(frame)
+    
+    def record_frame(self, frame: np.ndarray):
+        """Queue a snapshot of frame for the recording"""
+        if self.recording_queue.full():
+            # Dropping keeps the live view at camera rate when encoding can't keep up
+            self.recording_dropped += 1
+            return
+        try:
+            buffer = self.recording_buffers.get_nowait()
+        except queue.Empty:
+            buffer = None
+        if buffer is None or buffer.shape != frame.shape:
+            buffer = np.empty(frame.shape, dtype=np.uint8)
+        # Copying into an owned, contiguous buffer means the caller can keep drawing on
+        # frame, and VideoWriter never has to make its own contiguous copy
+        np.copyto(buffer, frame)
+        self.recording_queue.put_nowait(buffer)
+    
     def stop_recording(self):
         """Stop recording video"""
         if not self.recording:
             return
         
+        if self.recording_thread:
+            # Let the writer drain what's queued before the file is closed
+            self.recording_queue.put(None)
+            self.recording_thread.join()
+            self.recording_thread = None
+            self.recording_queue = None
+            self.recording_buffers = None
+            if self.recording_dropped:
+                self.logger.warning(f"Recording dropped {self.recording_dropped} frames (encoder fell behind)")
+        
         if self.video_writer:
             self.video_writer.release()
             self.video_writer = None
@@ -415,7 +642,7 @@ class InteractiveFilterViewer:
         if not UPDATE_CHECKER_AVAILABLE or not self.update_checker:
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         if not force and (current_time - self.last_update_check) < self.update_check_interval:
             return
         
@@ -439,6 +666,35 @@ class InteractiveFilterViewer:
             self.logger.error(f"Update check error: {e}", exception=str(e))
             print(f"Update check error: {e}")
         
+    def pull_updates(self):
+        """Pull updates with git (runs on the update thread, git can take tens of seconds)"""
+        self.logger.info("Pulling updates...")
+        print("Pulling updates...")
+        success, message = self.update_checker.pull_updates()
+        if success:
+            self.logger.log_event("update_pulled", {"success": True})
+            print(f"✅ {message}")
+            print("Please restart the application to apply updates.")
+            self.update_available = False
+        else:
+            self.logger.log_event("update_pull_failed", {"message": message})
+            print(f"❌ {message}")
+    
+    def update_check_loop(self):
+        """Run every update check (startup, periodic, manual) and pull on this one background thread"""
+        force = True
+        while True:
+            if self.update_pull_requested.is_set():
+                self.update_pull_requested.clear()
+                self.pull_updates()
+            else:
+                self.check_for_updates(force=force)
+            # Set means a manual check or pull was requested; a timeout is the periodic check
+            force = self.update_check_requested.wait(self.update_check_interval)
+            self.update_check_requested.clear()
+            if self.update_stop.is_set():
+                return
+    
     def __enter__(self):
         self.logger.info("Initializing interactive filter viewer")
         self.logger.log_event("viewer_start", {
@@ -451,8 +707,8 @@ class InteractiveFilterViewer:
         if UPDATE_CHECKER_AVAILABLE:
             try:
                 self.update_checker = UpdateChecker(self.config_path)
-                # Check for updates on startup
-                threading.Thread(target=self.check_for_updates, args=(True,), daemon=True).start()
+                # Check for updates on startup and then periodically, off the render thread
+                threading.Thread(target=self.update_check_loop, daemon=True).start()
                 self.logger.info("Update checker initialized")
             except Exception as e:
                 self.logger.warning(f"Could not initialize update checker: {e}")
@@ -478,17 +734,23 @@ class InteractiveFilterViewer:
         for idx in camera_indices_to_try:
             if idx != self.camera_index or self.camera_index is None:
                 print(f"Trying camera index {idx}...")
-            cap = cv2.VideoCapture(idx)
+            cap = self.open_camera(idx)
             
             if cap.isOpened():
+                # Drivers queue several frames by default, so every filtered frame would
+                # already be a few frames stale (the "filter feels laggy" effect)
+                if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                    self.logger.warning("Could not reduce capture buffer size")
                 cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
                 cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
                 cap.set(cv2.CAP_PROP_FPS, self.fps)
                 
-                import time
-                time.sleep(0.5)
-                
-                ret, test_frame = cap.read()
+                # Wait on the driver's first frame instead of a fixed sleep
+                ret, test_frame = False, None
+                for _ in range(3):
+                    if cap.grab():
+                        ret, test_frame = cap.retrieve()
+                        break
                 if ret and test_frame is not None:
                     self.cap = cap
                     if idx != self.camera_index:
@@ -539,12 +801,16 @@ class InteractiveFilterViewer:
         
         self.filter_app = FaceFilter(width=self.width, height=self.height, fps=self.fps)
         self.filter_app.__enter__()
+        self.filter_dispatch = self.build_filter_dispatch()
         
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.logger.info("Shutting down interactive filter viewer")
+        self.update_stop.set()
+        self.update_check_requested.set()
         self.stop_recording()
+        self.stop_capture()
         if self.filter_app:
             self.filter_app.__exit__(exc_type, exc_val, exc_tb)
         if self.cap:
@@ -554,69 +820,70 @@ class InteractiveFilterViewer:
             "frame_count": self.frame_count
         })
     
+    def build_filter_dispatch(self) -> Dict[str, Tuple[str, Callable]]:
+        """Resolve every known filter to (kind, bound FaceFilter method) once, up front"""
+        dispatch = {}
+        for filter_type in self.filter_entries:
+            if filter_type in ANIMATED_FILTERS:
+                kind = 'animated'
+            elif filter_type in FULL_IMAGE_FILTERS:
+                kind = 'full'
+            else:
+                kind = 'face'
+            method_name = FILTER_METHOD_ALIASES.get(filter_type, f'apply_{filter_type}')
+            filter_method = getattr(self.filter_app, method_name, None)
+            if filter_method and callable(filter_method):
+                dispatch[filter_type] = (kind, filter_method)
+        return dispatch
+    
+    def get_faces(self, frame: np.ndarray, all_faces: bool = False):
+        """Run face detection at most once per frame (and kind), reusing the result otherwise"""
+        # Holding the frame itself (not its id) means a later frame can never alias it
+        if self.face_cache_frame is not frame:
+            self.face_cache_frame = frame
+            self.face_cache = {}
+        if all_faces not in self.face_cache:
+            if all_faces:
+                self.face_cache[all_faces] = self.filter_app.detect_all_faces(frame)
+            else:
+                self.face_cache[all_faces] = self.filter_app.detect_face(frame)
+        return self.face_cache[all_faces]
+    
     def apply_filter(self, frame: np.ndarray, filter_type: Optional[str]) -> np.ndarray:
         if filter_type is None:
             return frame
         
-        animated_filters = {
-            'extreme_closeup', 'puzzle', 'fast_zoom_in', 'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom'
-        }
-        
-        full_image_filters = {
-            'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-            'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
-            'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
-            'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
-            'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
-            'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'rotate',
-            'rotate_45', 'rotate_90', 'flip_horizontal', 'flip_vertical',
-            'flip_both', 'quad_mirror', 'tile', 'radial_tile',
-            'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
-            'black_white', 'sepia', 'vintage', 'negative', 'posterize', 'sketch',
-            'cartoon', 'anime', 'thermal', 'ice', 'ocean', 'plasma', 'jet',
-            'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring',
-            'summer', 'autumn', 'winter', 'rainbow', 'rainbow_shift', 'acid_trip',
-            'vhs', 'retro', 'cyberpunk', 'glow', 'solarize', 'edge_detect',
-            'halftone', 'red_tint', 'blue_tint', 'green_tint', 'neon_glow',
-            'pixelate', 'blur', 'sharpen', 'emboss'
-        }
+        # Every FaceFilter.apply_* builds and returns its own output without writing to its
+        # input, so the camera frame is passed straight through rather than copied
         
         # Face mask filters are handled dynamically via apply_face_mask_from_asset
         # Check if this is a face mask filter by checking if it contains 'face_mask'
         try:
             if 'face_mask' in filter_type:
-                # Parse filter name to extract folder and mask name
-                parts = filter_type.split('_')
-                if len(parts) >= 3:
-                    folder = parts[0]
-                    mask_name = parts[-1]
-                    if folder == 'dropout':
-                        asset_dir = 'assets/dropout/face_mask'
-                    elif folder == 'assets':
-                        asset_dir = 'assets/face_mask'
-                    else:
-                        asset_dir = f'assets/{folder}/face_mask'
-                    faces = self.filter_app.detect_all_faces(frame)
+                # Folder and mask name are parsed once per filter name, not per frame
+                mask_asset = resolve_face_mask_asset(filter_type)
+                if mask_asset:
+                    asset_dir, mask_name = mask_asset
+                    faces = self.get_faces(frame, all_faces=True)
                     if faces:
                         for face in faces:
-                            frame = self.filter_app.apply_face_mask_from_asset(frame.copy(), face, mask_name, asset_dir=asset_dir)
+                            frame = self.filter_app.apply_face_mask_from_asset(frame, face, mask_name, asset_dir=asset_dir)
                 return frame
-            elif filter_type in animated_filters:
+            
+            dispatch = self.filter_dispatch.get(filter_type)
+            if dispatch is None:
+                return frame
+            kind, filter_method = dispatch
+            if kind == 'animated':
                 dummy_face = (0, 0, frame.shape[1], frame.shape[0])
-                filter_method = getattr(self.filter_app, f'apply_{filter_type}', None)
-                if filter_method and callable(filter_method):
-                    return filter_method(frame.copy(), dummy_face, self.frame_count)
-            elif filter_type in full_image_filters:
+                return filter_method(frame, dummy_face, self.frame_count)
+            elif kind == 'full':
                 dummy_face = (0, 0, frame.shape[1], frame.shape[0])
-                filter_method = getattr(self.filter_app, f'apply_{filter_type}', None)
-                if filter_method and callable(filter_method):
-                    return filter_method(frame.copy(), dummy_face)
+                return filter_method(frame, dummy_face)
             else:
-                face = self.filter_app.detect_face(frame)
+                face = self.get_faces(frame)
                 if face:
-                    filter_method = getattr(self.filter_app, f'apply_{filter_type}', None)
-                    if filter_method and callable(filter_method):
-                        return filter_method(frame.copy(), face)
+                    return filter_method(frame, face)
         except Exception as e:
             self.logger.error(f"Error applying filter {filter_type}: {e}", exception=str(e))
             print(f"Error applying filter {filter_type}: {e}")
@@ -638,38 +905,93 @@ class InteractiveFilterViewer:
             cv2.rectangle(img, (x1, y1), (x2, y2), color, thickness)
             return
         
-        # Draw main rectangle parts
-        cv2.rectangle(img, (x1 + radius, y1), (x2 - radius, y2), color, thickness)
-        cv2.rectangle(img, (x1, y1 + radius), (x2, y2 - radius), color, thickness)
-        
-        # Draw rounded corners (arcs)
-        cv2.ellipse(img, (x1 + radius, y1 + radius), (radius, radius), 180, 0, 90, color, thickness)
-        cv2.ellipse(img, (x2 - radius, y1 + radius), (radius, radius), 270, 0, 90, color, thickness)
-        cv2.ellipse(img, (x1 + radius, y2 - radius), (radius, radius), 90, 0, 90, color, thickness)
-        cv2.ellipse(img, (x2 - radius, y2 - radius), (radius, radius), 0, 0, 90, color, thickness)
+        # Trace the outline as one closed polyline: corner arcs (same angular step
+        # cv2.ellipse uses) joined by the straight edges
+        delta = 90 if radius < 3 else 30 if radius < 10 else 18 if radius < 15 else 5
+        corners = ((x1 + radius, y1 + radius, 180), (x2 - radius, y1 + radius, 270),
+                   (x2 - radius, y2 - radius, 0), (x1 + radius, y2 - radius, 90))
+        outline = np.concatenate([
+            cv2.ellipse2Poly((cx, cy), (radius, radius), angle, 0, 90, delta)
+            for cx, cy, angle in corners
+        ])
+        cv2.polylines(img, [outline], True, color, thickness)
     
     def draw_overlay(self, frame: np.ndarray) -> np.ndarray:
-        """Draw modern UI overlay matching standalone.html design"""
-        h, w = frame.shape[:2]
-        overlay = frame.copy()
-        
-        # Scale factor for responsive design
-        base_width = 1280
-        base_height = 720
-        scale_factor = min(w / base_width, h / base_height)
+        """Draw modern UI overlay matching standalone.html design.
         
+        Draws directly into frame (no full-frame copy) and returns it.
+        """
+        h, w = frame.shape[:2]
+        if not frame.flags.writeable:
+            frame = frame.copy()
+        
+        # The panel and status badge only change on UI events, so each is rendered once
+        # into a sprite and composited onto every frame until its inputs change
+        panel_key = (h, w, self.theme_name, self.theme_bgr, tuple(self.available_themes),
+                     self.search_query, self.search_active, self.current_filter,
+                     self.current_filter_name, tuple(self.favorites))
+        if panel_key != self.panel_sprite_key:
+            self.panel_sprite = self.render_sprite(h, w, self.draw_panel)
+            self.panel_sprite_key = panel_key
+        status_key = (h, w, self.theme_bgr, self.recording, self.update_available)
+        if status_key != self.status_sprite_key:
+            # The badge sits in the top strip, so only those rows need rendering
+            _, status_y, _, status_height = self.status_box(w, min(w / 1280, h / 720))
+            self.status_sprite = self.render_sprite(h, w, self.draw_status, rows=status_y + status_height + 1)
+            self.status_sprite_key = status_key
+        
+        self.blend_sprite(frame, self.panel_sprite)
+        self.blend_sprite(frame, self.status_sprite)
+        return frame
+    
+    def render_sprite(self, h: int, w: int, draw: Callable[[np.ndarray, int, int, float], None],
+                      rows: Optional[int] = None):
+        """Render draw() for an h x w frame into a (x, y, transmission, tint) sprite for blend_sprite.
+        
+        Every layer draw() makes is an opaque stroke or an addWeighted blend, so each output
+        pixel is frame * transmission / 255 + tint; drawing once over black and once over white
+        recovers both terms, cropped to the pixels draw() touched. Only the top rows of the
+        frame are rendered when given.
+        """
+        scale_factor = min(w / 1280, h / 720)
+        rows = min(rows or h, h)
+        dark = np.zeros((rows, w, 3), dtype=np.uint8)
+        light = np.full((rows, w, 3), 255, dtype=np.uint8)
+        draw(dark, h, w, scale_factor)
+        draw(light, h, w, scale_factor)
+        
+        # Non-zero wherever draw() touched a channel; channels are folded into columns
+        touched = cv2.bitwise_or(dark, cv2.bitwise_not(light)).reshape(rows, w * 3)
+        x, y, box_w, box_h = cv2.boundingRect(touched)
+        if box_w == 0:
+            return None
+        y1, y2 = y, y + box_h
+        x1, x2 = x // 3, (x + box_w + 2) // 3
+        # Both terms are exact in 8-bit: transmission in 1/255 steps, tint as drawn over black
+        tint = dark[y1:y2, x1:x2].copy()
+        transmission = cv2.subtract(light[y1:y2, x1:x2], tint)
+        return x1, y1, transmission, tint
+    
+    def blend_sprite(self, frame: np.ndarray, sprite):
+        if sprite is None:
+            return
+        x, y, transmission, tint = sprite
+        roi = frame[y:y + tint.shape[0], x:x + tint.shape[1]]
+        cv2.add(cv2.multiply(roi, transmission, scale=1 / 255), tint, dst=roi)
+    
+    def draw_panel(self, overlay: np.ndarray, h: int, w: int, scale_factor: float):
+        """Draw the controls panel (top-left)"""
         # Theme colors (matching HTML)
-        surface = tuple(self.theme['surface'])
-        surface_alpha = self.theme['bg_alpha']
-        text = tuple(self.theme['text'])
-        text_secondary = tuple(self.theme['textSecondary'])
-        accent = tuple(self.theme['accent'])
-        border = tuple(self.theme['border'])
-        status_connected = tuple(self.theme['statusConnected'])
-        status_error = tuple(self.theme['statusError'])
-        recording_color = tuple(self.theme['recording_color'])
-        update_color = tuple(self.theme['update_color'])
-        group_title = tuple(self.theme['groupTitle'])
+        theme = self.theme_bgr
+        surface = theme.surface
+        surface_alpha = theme.bg_alpha
+        text = theme.text
+        text_secondary = theme.textSecondary
+        accent = theme.accent
+        border = theme.border
+        group_title = theme.groupTitle
+        selected_text = theme.selectedText
+        surface_hover = theme.surfaceHover
         
         # Font settings
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -696,13 +1018,25 @@ class InteractiveFilterViewer:
         panel_height = int((estimated_lines * line_height) + (panel_padding * 2) + (section_spacing * 5))
         panel_height = min(panel_height, int(h * 0.85))  # Max 85% of screen height
         
+        # Layout steps and stroke widths, computed once rather than per row
+        content_right = panel_x + panel_width - panel_padding
+        content_bottom = panel_y + panel_height - panel_padding
+        row_step = int(line_height * 0.9)
+        row_above = int(line_height * 0.6)
+        row_below = int(line_height * 0.4)
+        half_line = int(line_height * 0.5)
+        section_gap = int(line_height * 1.2)
+        inset = int(4 * scale_factor)
+        stroke = max(1, int(scale_factor))
+        stroke_bold = max(1, int(1.1 * scale_factor))
+        search_lower = self.search_query
+        favorites = set(self.favorites)
+        haystacks = self.search_haystacks
+        
         # Draw controls panel background with rounded corners
         panel_roi = overlay[panel_y:panel_y+panel_height, panel_x:panel_x+panel_width]
         if panel_roi.size > 0:
-            bg_overlay = np.full(panel_roi.shape, surface, dtype=np.uint8)
-            overlay[panel_y:panel_y+panel_height, panel_x:panel_x+panel_width] = cv2.addWeighted(
-                panel_roi, 1 - surface_alpha, bg_overlay, surface_alpha, 0
-            )
+            tint_roi(panel_roi, surface, surface_alpha)
         
         # Draw rounded border
         self.draw_rounded_rect(overlay, (panel_x, panel_y), 
@@ -715,8 +1049,8 @@ class InteractiveFilterViewer:
         
         # Theme selector (matching HTML exactly)
         cv2.putText(overlay, 'Theme:', (text_x, y_pos), font, font_small, 
-                   text_secondary, max(1, int(scale_factor)))
-        y_pos += int(line_height * 0.9)
+                   text_secondary, stroke)
+        y_pos += row_step
         
         # Theme dropdown display (showing current with checkmark)
         current_theme_display = self.theme_name.title()
@@ -725,239 +1059,182 @@ class InteractiveFilterViewer:
                 current_theme_display = f'✓ {theme.title()}'
                 break
         cv2.putText(overlay, current_theme_display, (text_x, y_pos), font, font_small, 
-                   accent, max(1, int(scale_factor)))
-        y_pos += int(line_height * 1.2)
+                   accent, stroke)
+        y_pos += section_gap
         
         # Divider
-        cv2.line(overlay, (text_x, y_pos), (panel_x + panel_width - panel_padding, y_pos), 
+        cv2.line(overlay, (text_x, y_pos), (content_right, y_pos), 
                 border, 1)
-        y_pos += int(section_spacing)
+        y_pos += section_spacing
         
         # Search FX (matching HTML - input field style)
         cv2.putText(overlay, 'Search FX:', (text_x, y_pos), font, font_small, 
-                   text_secondary, max(1, int(scale_factor)))
-        y_pos += int(line_height * 0.9)
+                   text_secondary, stroke)
+        y_pos += row_step
         
         # Draw search input box (like HTML input field)
         search_box_y1 = y_pos - int(line_height * 0.7)
         search_box_y2 = y_pos + int(line_height * 0.3)
-        search_box_bg = overlay[search_box_y1:search_box_y2, text_x:panel_x + panel_width - panel_padding]
+        search_box_bg = overlay[search_box_y1:search_box_y2, text_x:content_right]
         if search_box_bg.size > 0:
-            input_bg = np.full(search_box_bg.shape, surface, dtype=np.uint8)
-            overlay[search_box_y1:search_box_y2, text_x:panel_x + panel_width - panel_padding] = cv2.addWeighted(
-                search_box_bg, 0.3, input_bg, 0.7, 0
-            )
+            tint_roi(search_box_bg, surface, 0.7)
         # Draw border around search box
         self.draw_rounded_rect(overlay, (text_x, search_box_y1), 
-                             (panel_x + panel_width - panel_padding, search_box_y2),
-                             accent if self.search_active else border, 1, int(4 * scale_factor))
+                             (content_right, search_box_y2),
+                             accent if self.search_active else border, 1, inset)
         
         # Search text
         search_text = self.search_query if self.search_query else 'Search FX...'
         search_color = text_secondary if not self.search_query else text
-        cv2.putText(overlay, search_text[:20], (text_x + int(4 * scale_factor), y_pos), font, font_small, 
-                   search_color, max(1, int(scale_factor)))
-        y_pos += int(line_height * 1.2)
+        cv2.putText(overlay, search_text[:20], (text_x + inset, y_pos), font, font_small, 
+                   search_color, stroke)
+        y_pos += section_gap
         
         # Divider
-        cv2.line(overlay, (text_x, y_pos), (panel_x + panel_width - panel_padding, y_pos), 
+        cv2.line(overlay, (text_x, y_pos), (content_right, y_pos), 
                 border, 1)
-        y_pos += int(section_spacing)
+        y_pos += section_spacing
         
         # Pinned section (matching HTML - yellow buttons with X)
         if self.favorites:
             cv2.putText(overlay, 'Pinned:', (text_x, y_pos), font, font_small, 
-                       text_secondary, max(1, int(scale_factor)))
-            y_pos += int(line_height * 0.9)
+                       text_secondary, stroke)
+            y_pos += row_step
             
             for fav_filter in self.favorites[:5]:  # Show max 5 pinned
-                if y_pos + int(line_height * 1.2) > panel_y + panel_height - panel_padding:
+                if y_pos + section_gap > content_bottom:
                     break
                 
                 # Find display name
-                fav_name = fav_filter.replace('_', ' ').title()
-                for ft, name in self.filter_list:
-                    if ft == fav_filter:
-                        fav_name = name
-                        break
+                entry = self.filter_entries.get(fav_filter)
+                fav_name = entry[1] if entry else fav_filter.replace('_', ' ').title()
                 
-                # Check if matches search
+                # Check if matches search (same haystack as the category lists below)
                 if self.search_query:
-                    search_lower = self.search_query.lower()
-                    if search_lower not in fav_name.lower() and search_lower not in fav_filter.lower():
+                    haystack = haystacks.get(fav_filter) or f'{fav_name.lower()}\0{fav_filter.lower()}'
+                    if search_lower not in haystack:
                         continue  # Skip if doesn't match search
                 
                 # Draw pinned button (yellow/accent colored like HTML)
-                button_y1 = y_pos - int(line_height * 0.6)
-                button_y2 = y_pos + int(line_height * 0.4)
+                button_y1 = y_pos - row_above
+                button_y2 = y_pos + row_below
                 button_width = panel_width - (panel_padding * 2)
                 
                 # Draw button background with accent color
                 button_bg_roi = overlay[button_y1:button_y2, text_x:text_x + button_width]
                 if button_bg_roi.size > 0:
-                    button_bg = np.full(button_bg_roi.shape, accent, dtype=np.uint8)
-                    overlay[button_y1:button_y2, text_x:text_x + button_width] = cv2.addWeighted(
-                        button_bg_roi, 0.2, button_bg, 0.8, 0
-                    )
+                    tint_roi(button_bg_roi, accent, 0.8)
                 
                 # Draw button border
                 self.draw_rounded_rect(overlay, (text_x, button_y1), 
                                      (text_x + button_width, button_y2),
-                                     accent, 1, int(4 * scale_factor))
+                                     accent, 1, inset)
                 
                 # Button text with X
                 button_text = f'{fav_name} X'
-                text_color = tuple(self.theme['selectedText']) if self.theme_name == 'dropout' else text
-                cv2.putText(overlay, button_text, (text_x + int(4 * scale_factor), y_pos), font, font_small, 
-                           text_color, max(1, int(scale_factor)))
+                text_color = selected_text if self.theme_name == 'dropout' else text
+                cv2.putText(overlay, button_text, (text_x + inset, y_pos), font, font_small, 
+                           text_color, stroke)
                 y_pos += int(line_height * 1.1)
         
         # Divider
         if self.favorites:
-            cv2.line(overlay, (text_x, y_pos), (panel_x + panel_width - panel_padding, y_pos), 
+            cv2.line(overlay, (text_x, y_pos), (content_right, y_pos), 
                     border, 1)
-            y_pos += int(section_spacing)
+            y_pos += section_spacing
         
         # Current FX (matching HTML - dropdown button style)
         cv2.putText(overlay, 'Current FX:', (text_x, y_pos), font, font_small, 
-                   text_secondary, max(1, int(scale_factor)))
-        y_pos += int(line_height * 0.9)
+                   text_secondary, stroke)
+        y_pos += row_step
         
         # Current FX button (large, accent colored, like HTML dropdown button)
-        button_y1 = y_pos - int(line_height * 0.6)
-        button_y2 = y_pos + int(line_height * 0.5)
+        button_y1 = y_pos - row_above
+        button_y2 = y_pos + half_line
         button_width = panel_width - (panel_padding * 2)
         
         # Draw button background
         button_bg_roi = overlay[button_y1:button_y2, text_x:text_x + button_width]
         if button_bg_roi.size > 0:
-            button_bg = np.full(button_bg_roi.shape, accent, dtype=np.uint8)
-            overlay[button_y1:button_y2, text_x:text_x + button_width] = cv2.addWeighted(
-                button_bg_roi, 0.1, button_bg, 0.9, 0
-            )
+            tint_roi(button_bg_roi, accent, 0.9)
         
         # Draw button border
         self.draw_rounded_rect(overlay, (text_x, button_y1), 
                              (text_x + button_width, button_y2),
-                             accent, 1, int(4 * scale_factor))
+                             accent, 1, inset)
         
         # Button text with pin icon
         pin_icon = '📌' if self.current_filter and self.current_filter in self.favorites else ''
         current_text = f'{self.current_filter_name} {pin_icon}'
-        text_color = tuple(self.theme['selectedText']) if self.theme_name == 'dropout' else text
-        cv2.putText(overlay, current_text, (text_x + int(4 * scale_factor), y_pos), font, font_medium, 
+        text_color = selected_text if self.theme_name == 'dropout' else text
+        cv2.putText(overlay, current_text, (text_x + inset, y_pos), font, font_medium, 
                    text_color, max(1, int(1.2 * scale_factor)))
         y_pos += int(line_height * 1.3)
         
         # Divider
-        cv2.line(overlay, (text_x, y_pos), (panel_x + panel_width - panel_padding, y_pos), 
+        cv2.line(overlay, (text_x, y_pos), (content_right, y_pos), 
                 border, 1)
-        y_pos += int(section_spacing)
+        y_pos += section_spacing
         
         # Filter categories (matching HTML structure)
-        filtered = self.get_filtered_filters()
         categorized = self.get_filters_by_category()
         
-        # Show DROPOUT first
-        if 'DROPOUT' in categorized and categorized['DROPOUT']:
-            if y_pos + line_height <= panel_y + panel_height - panel_padding:
-                # Category title (group header style)
-                cat_y1 = y_pos - int(line_height * 0.5)
-                cat_y2 = y_pos + int(line_height * 0.5)
-                cat_bg = overlay[cat_y1:cat_y2, text_x:panel_x + panel_width - panel_padding]
-                if cat_bg.size > 0:
-                    hover_bg = np.full(cat_bg.shape, tuple(self.theme['surfaceHover']), dtype=np.uint8)
-                    overlay[cat_y1:cat_y2, text_x:panel_x + panel_width - panel_padding] = cv2.addWeighted(
-                        cat_bg, 0.2, hover_bg, 0.8, 0
-                    )
-                cv2.putText(overlay, 'DROPOUT', (text_x, y_pos), font, font_group, 
-                           group_title, max(1, int(1.1 * scale_factor)))
-                y_pos += int(line_height * 1.0)
-                
-                # DROPOUT filters (skip pinned ones - they're in pinned section)
-                for filter_type, name in categorized['DROPOUT']:
-                    if y_pos + line_height > panel_y + panel_height - panel_padding:
-                        break
-                    # Skip if pinned
-                    if filter_type and filter_type in self.favorites:
-                        continue
-                    # Check search filter (skip if search active and doesn't match)
-                    if self.search_query:
-                        search_lower = self.search_query.lower()
-                        name_lower = name.lower()
-                        type_lower = filter_type.lower() if filter_type else ''
-                        if (search_lower not in name_lower and 
-                            search_lower not in type_lower and
-                            search_lower not in name_lower.replace(' ', '_')):
-                            continue
-                    is_active = filter_type == self.current_filter
-                    
-                    if is_active:
-                        item_y1 = y_pos - int(line_height * 0.6)
-                        item_y2 = y_pos + int(line_height * 0.4)
-                        item_bg = overlay[item_y1:item_y2, text_x:panel_x + panel_width - panel_padding]
-                        if item_bg.size > 0:
-                            accent_bg = np.full(item_bg.shape, accent, dtype=np.uint8)
-                            overlay[item_y1:item_y2, text_x:panel_x + panel_width - panel_padding] = cv2.addWeighted(
-                                item_bg, 0.3, accent_bg, 0.7, 0
-                            )
-                    color = tuple(self.theme['selectedText']) if is_active else text
-                    cv2.putText(overlay, name, (text_x, y_pos), font, font_small, 
-                               color, max(1, int(1.1 * scale_factor) if is_active else int(scale_factor)))
-                    y_pos += int(line_height * 0.9)
-        
-        # Show other categories
-        for category in ['Distortion', 'Color & Style']:
-            if category not in categorized or not categorized[category]:
+        # DROPOUT first, then the other categories, each skipping pinned items and search misses
+        for category in ('DROPOUT', 'Distortion', 'Color & Style'):
+            if not categorized.get(category):
                 continue
-            if y_pos + line_height > panel_y + panel_height - panel_padding:
+            if y_pos + line_height > content_bottom:
                 break
             
-            # Category title
-            cat_y1 = y_pos - int(line_height * 0.5)
-            cat_y2 = y_pos + int(line_height * 0.5)
-            cat_bg = overlay[cat_y1:cat_y2, text_x:panel_x + panel_width - panel_padding]
+            # Category title (group header style)
+            cat_y1 = y_pos - half_line
+            cat_y2 = y_pos + half_line
+            cat_bg = overlay[cat_y1:cat_y2, text_x:content_right]
             if cat_bg.size > 0:
-                hover_bg = np.full(cat_bg.shape, tuple(self.theme['surfaceHover']), dtype=np.uint8)
-                overlay[cat_y1:cat_y2, text_x:panel_x + panel_width - panel_padding] = cv2.addWeighted(
-                    cat_bg, 0.2, hover_bg, 0.8, 0
-                )
+                tint_roi(cat_bg, surface_hover, 0.8)
             cv2.putText(overlay, category.upper(), (text_x, y_pos), font, font_group, 
-                       group_title, max(1, int(1.1 * scale_factor)))
-            y_pos += int(line_height * 1.0)
+                       group_title, stroke_bold)
+            y_pos += line_height
             
-            # Category filters (skip pinned, apply search filter)
             for filter_type, name in categorized[category]:
-                if y_pos + line_height > panel_y + panel_height - panel_padding:
+                if y_pos + line_height > content_bottom:
                     break
-                # Skip if pinned
-                if filter_type and filter_type in self.favorites:
+                # Skip if pinned (pinned items shown separately above)
+                if filter_type and filter_type in favorites:
                     continue
                 # Check search filter (skip if search active and doesn't match)
-                if self.search_query:
-                    search_lower = self.search_query.lower()
-                    name_lower = name.lower()
-                    type_lower = filter_type.lower() if filter_type else ''
-                    if (search_lower not in name_lower and 
-                        search_lower not in type_lower and
-                        search_lower not in name_lower.replace(' ', '_')):
-                        continue
+                if self.search_query and search_lower not in haystacks[filter_type]:
+                    continue
                 is_active = filter_type == self.current_filter
                 
                 if is_active:
-                    item_y1 = y_pos - int(line_height * 0.6)
-                    item_y2 = y_pos + int(line_height * 0.4)
-                    item_bg = overlay[item_y1:item_y2, text_x:panel_x + panel_width - panel_padding]
+                    item_y1 = y_pos - row_above
+                    item_y2 = y_pos + row_below
+                    item_bg = overlay[item_y1:item_y2, text_x:content_right]
                     if item_bg.size > 0:
-                        accent_bg = np.full(item_bg.shape, accent, dtype=np.uint8)
-                        overlay[item_y1:item_y2, text_x:panel_x + panel_width - panel_padding] = cv2.addWeighted(
-                            item_bg, 0.3, accent_bg, 0.7, 0
-                        )
+                        tint_roi(item_bg, accent, 0.7)
                 
-                color = tuple(self.theme['selectedText']) if is_active else text
+                color = selected_text if is_active else text
                 cv2.putText(overlay, name, (text_x, y_pos), font, font_small, 
-                           color, max(1, int(1.1 * scale_factor) if is_active else int(scale_factor)))
-                y_pos += int(line_height * 0.9)
+                           color, stroke_bold if is_active else stroke)
+                y_pos += row_step
+    
+    def status_box(self, w: int, scale_factor: float) -> Tuple[int, int, int, int]:
+        """(x, y, width, height) of the status indicator"""
+        return (w - int(120 * scale_factor), int(10 * scale_factor),
+                int(100 * scale_factor), int(30 * scale_factor))
+    
+    def draw_status(self, overlay: np.ndarray, h: int, w: int, scale_factor: float):
+        """Draw the status indicator (top-right)"""
+        theme = self.theme_bgr
+        surface = theme.surface
+        surface_alpha = theme.bg_alpha
+        text = theme.text
+        status_connected = theme.statusConnected
+        recording_color = theme.recording_color
+        update_color = theme.update_color
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        font_small = max(0.3, 0.45 * scale_factor)
         
         # Status indicator (top-right, matching HTML)
         status_text = 'READY'
@@ -969,18 +1246,12 @@ class InteractiveFilterViewer:
             status_text = 'UPDATE'
             status_bg_color = update_color
         
-        status_x = w - int(120 * scale_factor)
-        status_y_pos = int(10 * scale_factor)
-        status_width = int(100 * scale_factor)
-        status_height = int(30 * scale_factor)
+        status_x, status_y_pos, status_width, status_height = self.status_box(w, scale_factor)
         
         # Draw status background
         status_roi = overlay[status_y_pos:status_y_pos+status_height, status_x:status_x+status_width]
         if status_roi.size > 0:
-            status_bg = np.full(status_roi.shape, surface, dtype=np.uint8)
-            overlay[status_y_pos:status_y_pos+status_height, status_x:status_x+status_width] = cv2.addWeighted(
-                status_roi, 1 - surface_alpha, status_bg, surface_alpha, 0
-            )
+            tint_roi(status_roi, surface, surface_alpha)
         
         # Draw status border with accent color
         self.draw_rounded_rect(overlay, (status_x, status_y_pos), 
@@ -993,8 +1264,171 @@ class InteractiveFilterViewer:
         status_text_y = status_y_pos + (status_height + text_h) // 2
         cv2.putText(overlay, status_text, (status_text_x, status_text_y), font, font_small, 
                    text, max(1, int(scale_factor)))
-        
-        return overlay
+    
+    def build_key_handlers(self) -> Dict[int, Callable[[int, float], Optional[bool]]]:
+        """Map key codes (low byte) to handler(key_code, current_time); True from a handler quits"""
+        handlers = {}
+        
+        def bind(keys, handler):
+            for key in keys:
+                # First binding wins, so 'Q' keeps precedence over the GTK left-arrow byte (81)
+                handlers.setdefault(ord(key) if isinstance(key, str) else key, handler)
+        
+        bind('qQ', lambda key_code, now: True)
+        bind('hH', self.on_toggle_ui_key)
+        bind(' ', self.on_auto_advance_key)
+        bind((13, 10), self.on_enter_key)
+        bind((81, 2), self.on_previous_key)  # left arrow (GTK low byte, macOS)
+        bind((83, 3), self.on_next_key)  # right arrow (GTK low byte, macOS)
+        bind('0123456789', self.on_digit_key)
+        bind('fF', lambda key_code, now: self.toggle_favorite(self.current_filter))
+        bind('rR', self.on_record_key)
+        bind('uU', self.on_update_key)
+        bind('tT', self.on_theme_key)
+        bind('/?', self.on_search_key)
+        return handlers
+    
+    def select_filter_index(self, index: int):
+        self.auto_advance = False
+        self.number_buffer = ''
+        self.current_filter_index = index % len(self.filter_list)
+        self.current_filter, self.current_filter_name = self.filter_list[self.current_filter_index]
+        print(f"Switched to: {self.current_filter_name}")
+    
+    def commit_number_buffer(self):
+        """Switch to the filter number typed so far"""
+        try:
+            display_num = int(self.number_buffer)
+            filter_index = self.display_number_to_index(display_num)
+            if filter_index is not None:
+                self.auto_advance = False
+                self.current_filter_index = filter_index
+                self.current_filter, self.current_filter_name = self.filter_list[filter_index]
+                print(f"Switched to filter {display_num}: {self.current_filter_name}")
+            else:
+                print(f"Filter number {display_num} out of range")
+        except ValueError:
+            pass
+        self.number_buffer = ''
+    
+    def on_toggle_ui_key(self, key_code: int, current_time: float):
+        self.show_ui = not self.show_ui
+        print(f"UI {'hidden' if not self.show_ui else 'shown'}")
+    
+    def on_auto_advance_key(self, key_code: int, current_time: float):
+        self.auto_advance = not self.auto_advance
+        self.last_advance_time = current_time
+        status = "ON" if self.auto_advance else "OFF"
+        print(f"Auto-advance: {status}")
+    
+    def on_enter_key(self, key_code: int, current_time: float):
+        if self.search_active or self.search_query:
+            self.handle_search_key(key_code, current_time)
+        elif self.number_buffer:
+            self.commit_number_buffer()
+    
+    def on_previous_key(self, key_code: int, current_time: float):
+        self.select_filter_index(self.current_filter_index - 1)
+    
+    def on_next_key(self, key_code: int, current_time: float):
+        self.select_filter_index(self.current_filter_index + 1)
+    
+    def on_digit_key(self, key_code: int, current_time: float):
+        self.number_buffer += chr(key_code)
+        self.last_number_input_time = current_time
+        try:
+            display_num = int(self.number_buffer)
+            filter_index = self.display_number_to_index(display_num)
+            if filter_index is not None:
+                filter_name = self.filter_list[filter_index][1]
+                print(f"Entering filter number: {self.number_buffer} -> {filter_name} (press Enter or wait 1s)")
+            else:
+                print(f"Filter number {display_num} out of range")
+        except ValueError:
+            pass
+    
+    def on_record_key(self, key_code: int, current_time: float):
+        if self.recording:
+            self.stop_recording()
+        else:
+            self.start_recording()
+    
+    def on_update_key(self, key_code: int, current_time: float):
+        if self.update_available and self.update_checker:
+            self.update_pull_requested.set()
+        else:
+            self.logger.info("Checking for updates manually...")
+            print("Checking for updates...")
+        self.update_check_requested.set()
+    
+    def on_theme_key(self, key_code: int, current_time: float):
+        # Cycle themes
+        current_idx = self.available_themes.index(self.theme_name)
+        next_idx = (current_idx + 1) % len(self.available_themes)
+        self.switch_theme(self.available_themes[next_idx])
+    
+    def on_search_key(self, key_code: int, current_time: float):
+        # Start/activate search (if not already active)
+        if not self.search_active:
+            self.search_active = True
+            self.search_buffer = ''
+            self.search_query = ''
+            print("Search active: Type to search, Enter to select first result, Esc to clear")
+        else:
+            # If already active, treat as character input
+            self.search_buffer += '/'
+            self.search_query = self.search_buffer
+            self.last_search_key_time = current_time
+            self.search_pending = True
+    
+    def report_search_results(self):
+        """Print the match count for the query typed so far"""
+        self.search_pending = False
+        if not self.search_query:
+            return
+        filtered = self.get_filtered_filters()
+        count = len(filtered) if filtered else 0
+        print(f"Search: '{self.search_query}' ({count} results)")
+    
+    def handle_search_key(self, key_code: int, current_time: float):
+        """Edit the search query while search is active"""
+        if key_code == 27:  # Escape - clear search
+            self.search_query = ''
+            self.search_buffer = ''
+            self.search_active = False
+            print("Search cleared")
+        elif key_code == 8:  # Backspace
+            if self.search_buffer:
+                self.search_buffer = self.search_buffer[:-1]
+                self.search_query = self.search_buffer
+                print(f"Search: {self.search_query}")
+        elif key_code == 13 or key_code == 10:  # Enter - select first result
+            filtered = self.get_filtered_filters()
+            if filtered and len(filtered) > 0:
+                # Try pinned first
+                pinned_matches = [f for f in filtered if f[0] and f[0] in self.favorites]
+                if pinned_matches:
+                    filter_type, name = pinned_matches[0]
+                else:
+                    filter_type, name = filtered[0]
+                
+                # Find and select
+                if filter_type in self.filter_positions:
+                    self.current_filter_index = self.filter_positions[filter_type]
+                    self.current_filter = filter_type
+                    self.current_filter_name = name
+                    self.search_query = ''
+                    self.search_buffer = ''
+                    self.search_active = False
+                    print(f"Selected: {name}")
+        elif SEARCH_KEY_CHARS[key_code]:
+            # Add character to search
+            if not self.search_active:
+                self.search_active = True
+            self.search_buffer += SEARCH_KEY_CHARS[key_code]
+            self.search_query = self.search_buffer
+            self.last_search_key_time = current_time
+            self.search_pending = True
     
     def run(self):
         print("WesWorld FX - Interactive Filter Viewer")
@@ -1025,26 +1459,25 @@ class InteractiveFilterViewer:
         cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
         cv2.resizeWindow(self.window_name, self.display_width, self.display_height)
         
-        frame_time = max(1, 1000 // self.fps)
         consecutive_failures = 0
         max_failures = 10
+        window_poll_interval = 8  # frames between window size queries
         
+        self.start_capture()
         while True:
-            ret, frame = self.cap.read()
+            ret, frame = self.read_latest_frame()
             if not ret or frame is None:
                 consecutive_failures += 1
                 if consecutive_failures >= max_failures:
                     print("\nError: Could not read frames from camera")
                     print("Camera may have been disconnected or is being used by another application.")
                     break
-                import time
-                time.sleep(0.1)
+                # The capture thread already backs off between failed reads
                 continue
             
             consecutive_failures = 0
             
-            import time
-            current_time = time.time()
+            current_time = time.monotonic()
             self.frame_count += 1
             
             frame = cv2.flip(frame, 1)
@@ -1060,26 +1493,26 @@ class InteractiveFilterViewer:
             
             # Write to video if recording
             if self.recording and self.video_writer:
-                self.video_writer.write(filtered_frame)
+                self.record_frame(filtered_frame)
             
             if self.show_ui:
                 display_frame = self.draw_overlay(filtered_frame)
             else:
                 display_frame = filtered_frame
             
-            # Periodic update check (every 5 minutes)
-            if UPDATE_CHECKER_AVAILABLE and self.update_checker:
-                if current_time - self.last_update_check > self.update_check_interval:
-                    threading.Thread(target=self.check_for_updates, daemon=True).start()
+            # HighGUI has no resize event, so the window size is polled every few frames
+            if self.frame_count % window_poll_interval == 1:
+                try:
+                    window_size = cv2.getWindowImageRect(self.window_name)
+                    if window_size[2] > 0 and window_size[3] > 0:
+                        self.display_width = window_size[2]
+                        self.display_height = window_size[3]
+                except:
+                    pass
             
-            try:
-                window_size = cv2.getWindowImageRect(self.window_name)
-                if window_size[2] > 0 and window_size[3] > 0:
-                    self.display_width = window_size[2]
-                    self.display_height = window_size[3]
-                    display_frame = cv2.resize(display_frame, (self.display_width, self.display_height), interpolation=cv2.INTER_LINEAR)
-            except:
-                pass
+            # Scale only when the window doesn't already match the frame
+            if display_frame.shape[:2] != (self.display_height, self.display_width):
+                display_frame = cv2.resize(display_frame, (self.display_width, self.display_height), interpolation=cv2.INTER_LINEAR)
             
             window_title = 'WesWorld FX'
             if self.auto_advance:
@@ -1091,178 +1524,25 @@ class InteractiveFilterViewer:
             cv2.setWindowTitle(self.window_name, window_title)
             cv2.imshow(self.window_name, display_frame)
             
-            key = cv2.waitKey(frame_time)
+            # Frames are paced by the capture thread, so only pump GUI events here;
+            # waiting a full frame interval on top of that halved the frame rate
+            key = cv2.pollKey()
             
             if key == -1:
                 if self.number_buffer and current_time - self.last_number_input_time > self.number_input_timeout:
-                    try:
-                        display_num = int(self.number_buffer)
-                        filter_index = self.display_number_to_index(display_num)
-                        if filter_index is not None:
-                            self.auto_advance = False
-                            self.current_filter_index = filter_index
-                            self.current_filter, self.current_filter_name = self.filter_list[filter_index]
-                            print(f"Switched to filter {display_num}: {self.current_filter_name}")
-                        else:
-                            print(f"Filter number {display_num} out of range")
-                    except ValueError:
-                        pass
-                    self.number_buffer = ''
+                    self.commit_number_buffer()
+                if self.search_pending and current_time - self.last_search_key_time > self.search_debounce:
+                    self.report_search_results()
                 continue
                 
             key_code = key & 0xFF
             
-            if key_code == ord('q') or key_code == ord('Q'):
-                break
-            elif key_code == ord('h') or key_code == ord('H'):
-                self.show_ui = not self.show_ui
-                print(f"UI {'hidden' if not self.show_ui else 'shown'}")
-            elif key_code == ord(' ') or key_code == 32:
-                self.auto_advance = not self.auto_advance
-                self.last_advance_time = current_time
-                status = "ON" if self.auto_advance else "OFF"
-                print(f"Auto-advance: {status}")
-            elif key_code == 13 or key_code == 10:
-                if self.number_buffer:
-                    try:
-                        display_num = int(self.number_buffer)
-                        filter_index = self.display_number_to_index(display_num)
-                        if filter_index is not None:
-                            self.auto_advance = False
-                            self.current_filter_index = filter_index
-                            self.current_filter, self.current_filter_name = self.filter_list[filter_index]
-                            print(f"Switched to filter {display_num}: {self.current_filter_name}")
-                        else:
-                            print(f"Filter number {display_num} out of range")
-                    except ValueError:
-                        pass
-                    self.number_buffer = ''
-            elif key == 81 or key == 65361 or key == 2:
-                self.auto_advance = False
-                self.number_buffer = ''
-                self.current_filter_index = (self.current_filter_index - 1) % len(self.filter_list)
-                self.current_filter, self.current_filter_name = self.filter_list[self.current_filter_index]
-                print(f"Switched to: {self.current_filter_name}")
-            elif key == 83 or key == 65363 or key == 3:
-                self.auto_advance = False
-                self.number_buffer = ''
-                self.current_filter_index = (self.current_filter_index + 1) % len(self.filter_list)
-                self.current_filter, self.current_filter_name = self.filter_list[self.current_filter_index]
-                print(f"Switched to: {self.current_filter_name}")
-            elif key_code >= ord('0') and key_code <= ord('9'):
-                self.number_buffer += chr(key_code)
-                self.last_number_input_time = current_time
-                try:
-                    display_num = int(self.number_buffer)
-                    filter_index = self.display_number_to_index(display_num)
-                    if filter_index is not None:
-                        filter_name = self.filter_list[filter_index][1]
-                        print(f"Entering filter number: {self.number_buffer} -> {filter_name} (press Enter or wait 1s)")
-                    else:
-                        print(f"Filter number {display_num} out of range")
-                except ValueError:
-                    pass
-            elif chr(key_code) in self.filters:
-                self.auto_advance = False
-                self.number_buffer = ''
-                filter_type, filter_name = self.filters[chr(key_code)]
-                try:
-                    self.current_filter_index = next(i for i, (f, _) in enumerate(self.filter_list) if f == filter_type)
-                except StopIteration:
-                    continue
-                self.current_filter = filter_type
-                self.current_filter_name = filter_name
-                print(f"Switched to: {filter_name}")
-            elif key_code == ord('f') or key_code == ord('F'):
-                self.toggle_favorite(self.current_filter)
-            elif key_code == ord('r') or key_code == ord('R'):
-                if self.recording:
-                    self.stop_recording()
-                else:
-                    self.start_recording()
-            elif key_code == ord('u') or key_code == ord('U'):
-                if self.update_available and self.update_checker:
-                    self.logger.info("Pulling updates...")
-                    print("Pulling updates...")
-                    success, message = self.update_checker.pull_updates()
-                    if success:
-                        self.logger.log_event("update_pulled", {"success": True})
-                        print(f"✅ {message}")
-                        print("Please restart the application to apply updates.")
-                        self.update_available = False
-                    else:
-                        self.logger.log_event("update_pull_failed", {"message": message})
-                        print(f"❌ {message}")
-                else:
-                    self.logger.info("Checking for updates manually...")
-                    print("Checking for updates...")
-                    self.check_for_updates(force=True)
-            elif key_code == ord('t') or key_code == ord('T'):
-                # Cycle themes
-                current_idx = self.available_themes.index(self.theme_name)
-                next_idx = (current_idx + 1) % len(self.available_themes)
-                self.switch_theme(self.available_themes[next_idx])
-            elif key_code == ord('/') or key_code == ord('?'):
-                # Start/activate search (if not already active)
-                if not self.search_active:
-                    self.search_active = True
-                    self.search_buffer = ''
-                    self.search_query = ''
-                    print("Search active: Type to search, Enter to select first result, Esc to clear")
-                else:
-                    # If already active, treat as character input
-                    self.search_buffer += '/'
-                    self.search_query = self.search_buffer
-                    self.last_search_key_time = current_time
-                    filtered = self.get_filtered_filters()
-                    count = len(filtered) if filtered else 0
-                    print(f"Search: '{self.search_query}' ({count} results)")
+            handler = self.key_handlers.get(key_code)
+            if handler is not None:
+                if handler(key_code, current_time):
+                    break
             elif self.search_active or self.search_query:
-                if key_code == 27:  # Escape - clear search
-                    self.search_query = ''
-                    self.search_buffer = ''
-                    self.search_active = False
-                    print("Search cleared")
-                elif key_code == 8:  # Backspace
-                    if self.search_buffer:
-                        self.search_buffer = self.search_buffer[:-1]
-                        self.search_query = self.search_buffer
-                        print(f"Search: {self.search_query}")
-                elif key_code == 13 or key_code == 10:  # Enter - select first result
-                    filtered = self.get_filtered_filters()
-                    if filtered and len(filtered) > 0:
-                        # Try pinned first
-                        pinned_matches = [f for f in filtered if f[0] and f[0] in self.favorites]
-                        if pinned_matches:
-                            filter_type, name = pinned_matches[0]
-                        else:
-                            filter_type, name = filtered[0]
-                        
-                        # Find and select
-                        for i, (ft, n) in enumerate(self.filter_list):
-                            if ft == filter_type:
-                                self.current_filter_index = i
-                                self.current_filter = filter_type
-                                self.current_filter_name = name
-                                self.search_query = ''
-                                self.search_buffer = ''
-                                self.search_active = False
-                                print(f"Selected: {name}")
-                                break
-                elif (key_code >= ord('a') and key_code <= ord('z')) or \
-                     (key_code >= ord('A') and key_code <= ord('Z')) or \
-                     (key_code >= ord('0') and key_code <= ord('9')) or \
-                     key_code == ord(' ') or key_code == ord('_') or key_code == ord('-'):
-                    # Add character to search
-                    if not self.search_active:
-                        self.search_active = True
-                    char = chr(key_code).lower() if key_code != ord(' ') else ' '
-                    self.search_buffer += char
-                    self.search_query = self.search_buffer
-                    self.last_search_key_time = current_time
-                    filtered = self.get_filtered_filters()
-                    count = len(filtered) if filtered else 0
-                    print(f"Search: '{self.search_query}' ({count} results)")
+                self.handle_search_key(key_code, current_time)
             
             # Check if search should timeout (clear after inactivity)
             if self.search_query and not self.search_active:
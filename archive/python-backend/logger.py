@@ -5,6 +5,7 @@ All logs are written to logs/ directory as JSON files
 import json
 import os
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, Optional, Any
 from pathlib import Path
@@ -19,6 +20,7 @@ class JSONLogger:
         self.logs_dir.mkdir(exist_ok=True)
         self.log_file = self.logs_dir / f"{component}.jsonl"
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.pending = None  # Lines held back inside buffered()
         
     def _write_log(self, level: str, message: str, **kwargs):
         """Write a log entry to JSON file"""
@@ -30,14 +32,34 @@ class JSONLogger:
             "message": message,
             **kwargs
         }
-        
+        line = json.dumps(log_entry) + '\n'
+        if self.pending is not None:
+            self.pending.append(line)
+            return
+        self._append(line)
+    
+    def _append(self, text: str):
         try:
             with open(self.log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+                f.write(text)
         except Exception as e:
             # Fallback to stderr if logging fails
             print(f"Logging error: {e}", file=__import__('sys').stderr)
     
+    @contextmanager
+    def buffered(self):
+        """Collect the log entries of a burst and append them with a single write"""
+        if self.pending is not None:
+            yield self
+            return
+        self.pending = []
+        try:
+            yield self
+        finally:
+            pending, self.pending = self.pending, None
+            if pending:
+                self._append(''.join(pending))
+    
     def debug(self, message: str, **kwargs):
         """Log debug message"""
         self._write_log("DEBUG", message, **kwargs)
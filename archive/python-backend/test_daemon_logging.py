@@ -6,6 +6,7 @@ import os
 import sys
 import time
 import json
+import traceback
 from pathlib import Path
 
 def test_logger():
@@ -18,11 +19,12 @@ def test_logger():
         from logger import get_logger
         
         logger = get_logger("test", "logs")
-        logger.info("Test info message")
-        logger.warning("Test warning message")
-        logger.error("Test error message")
-        logger.log_event("test_event", {"test": True, "number": 42})
-        logger.log_performance("test_operation", 0.123)
+        with logger.buffered():
+            logger.info("Test info message")
+            logger.warning("Test warning message")
+            logger.error("Test error message")
+            logger.log_event("test_event", {"test": True, "number": 42})
+            logger.log_performance("test_operation", 0.123)
         
         # Check if log file was created
         log_file = Path("logs/test.jsonl")
@@ -30,9 +32,16 @@ def test_logger():
             print(f"✅ Log file created: {log_file}")
             
             # Verify JSON format
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                print(f"✅ Log file has {len(lines)} entries")
+            with open(log_file, 'rb') as f:
+                count = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+                print(f"✅ Log file has {count} entries")
+                
+                # Only the tail is parsed, so the log can grow across runs
+                start = max(0, f.tell() - 8192)
+                f.seek(start)
+                lines = f.read().splitlines()
+                if start:
+                    lines = lines[1:]  # May begin mid-entry
                 
                 for i, line in enumerate(lines[-3:], 1):  # Check last 3 entries
                     try:
@@ -48,7 +57,6 @@ def test_logger():
         return True
     except Exception as e:
         print(f"❌ Logger test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -80,7 +88,6 @@ def test_daemon_imports():
         return True
     except Exception as e:
         print(f"❌ Daemon import test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -111,7 +118,6 @@ def test_interactive_logging():
         return True
     except Exception as e:
         print(f"❌ Interactive filters test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -135,7 +141,6 @@ def test_update_checker_logging():
         return True
     except Exception as e:
         print(f"❌ Update checker test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -155,8 +160,8 @@ def check_log_files():
         print(f"✅ Found {len(log_files)} log file(s):")
         for log_file in log_files:
             size = log_file.stat().st_size
-            with open(log_file, 'r') as f:
-                lines = len(f.readlines())
+            with open(log_file, 'rb') as f:
+                lines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
             print(f"   - {log_file.name}: {lines} entries, {size} bytes")
     else:
         print("⚠️  No log files found (may be normal if nothing has run yet)")
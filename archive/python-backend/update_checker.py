@@ -4,6 +4,7 @@ Checks GitHub for updates and can pull/reload if needed
 """
 import json
 import os
+import shutil
 import subprocess
 import sys
 import time
@@ -26,13 +27,27 @@ except ImportError:
         return DummyLogger()
 
 
+# Seconds last_check has to advance before it alone is worth rewriting config.json for
+LAST_CHECK_PERSIST_INTERVAL = 30
+
+
 class UpdateChecker:
     def __init__(self, config_path: str = 'config.json'):
         self.config_path = config_path
         self.repo_url = 'https://github.com/wesworldio/ww-fx-1'
         self.api_base = 'https://api.github.com/repos/wesworldio/ww-fx-1'
+        self.repo_dir = os.path.dirname(os.path.abspath(__file__))
+        self.git_bin = shutil.which('git') or 'git'  # Resolve PATH once, not per git call
         self.last_check_time = 0
+        self.current_commit = None  # HEAD only moves when pull_updates runs
+        self.latest_etag = None  # ETag and result of the last commit fetch, per branch
+        self.latest_branch = None
+        self.latest_commit = None
         self.update_config = self.load_update_config()
+        # Interval checks run off the monotonic clock; the wall-clock last_check is only
+        # persisted so a restart within the interval still waits
+        since_last_check = max(0.0, time.time() - self.update_config['last_check'])
+        self.next_check_at = time.monotonic() + self.update_config['check_interval'] - since_last_check
         self.logger = get_logger("update_checker", "logs")
         
     def load_update_config(self) -> Dict:
@@ -75,6 +90,14 @@ class UpdateChecker:
         else:
             config = {}
         
+        # The file is shared with the viewer's settings, so it is re-read rather than
+        # overwritten from memory. A write is skipped when the only change is last_check
+        # moving by less than LAST_CHECK_PERSIST_INTERVAL (manual and startup checks)
+        on_disk = config.get('updates')
+        if (isinstance(on_disk, dict)
+                and {**on_disk, 'last_check': update_config['last_check']} == update_config
+                and update_config['last_check'] - (on_disk.get('last_check') or 0) < LAST_CHECK_PERSIST_INTERVAL):
+            return
         config['updates'] = update_config
         try:
             with open(self.config_path, 'w') as f:
@@ -82,18 +105,49 @@ class UpdateChecker:
         except Exception as e:
             print(f"Warning: Could not save update config: {e}")
     
+    def read_head(self) -> Optional[str]:
+        """Read HEAD's commit hash from the .git directory without running git
+        
+        Returns None when git has to be asked (packed refs, worktrees, submodules)
+        """
+        directory = self.repo_dir
+        while not os.path.exists(os.path.join(directory, '.git')):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+        git_dir = os.path.join(directory, '.git')
+        # A .git file points elsewhere (worktree, submodule); leave those to git
+        if not os.path.isdir(git_dir):
+            return None
+        try:
+            with open(os.path.join(git_dir, 'HEAD')) as f:
+                head = f.read().strip()
+            if head.startswith('ref: '):
+                with open(os.path.join(git_dir, head[5:])) as f:
+                    head = f.read().strip()
+        except OSError:
+            return None
+        return head if len(head) == 40 else None
+    
     def get_current_commit(self) -> Optional[str]:
         """Get current git commit hash"""
+        if self.current_commit:
+            return self.current_commit
+        self.current_commit = self.read_head()
+        if self.current_commit:
+            return self.current_commit
         try:
             result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
+                [self.git_bin, 'rev-parse', 'HEAD'],
                 capture_output=True,
                 text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__)),
+                cwd=self.repo_dir,
                 timeout=5
             )
             if result.returncode == 0:
-                return result.stdout.strip()
+                self.current_commit = result.stdout.strip()
+                return self.current_commit
         except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
             pass
         return None
@@ -108,17 +162,32 @@ class UpdateChecker:
             return None
             
         try:
-            url = f"{self.api_base}/commits/{branch}"
+            # The list endpoint with per_page=1 returns the head commit without the
+            # files/stats payload of /commits/{branch} (~1 KB instead of tens of KB)
+            url = f"{self.api_base}/commits?sha={branch}&per_page=1"
             request = Request(url)
             request.add_header('Accept', 'application/vnd.github.v3+json')
             request.add_header('User-Agent', 'WesWorld-FX-UpdateChecker/1.0')
+            # A conditional request answers 304 with no body when nothing was pushed,
+            # and doesn't count against the API rate limit
+            if self.latest_etag and self.latest_branch == branch:
+                request.add_header('If-None-Match', self.latest_etag)
             
             with urlopen(request, timeout=10) as response:
-                data = json.loads(response.read().decode())
+                data = (json.loads(response.read().decode()) or [{}])[0]
                 commit_hash = data.get('sha', '')[:7]  # Short hash
                 commit_message = data.get('commit', {}).get('message', '').split('\n')[0]
-                return (commit_hash, commit_message)
-        except (URLError, HTTPError, json.JSONDecodeError, TimeoutError) as e:
+                self.latest_etag = response.headers.get('ETag')
+                self.latest_branch = branch
+                self.latest_commit = (commit_hash, commit_message)
+                return self.latest_commit
+        except HTTPError as e:
+            if e.code == 304 and self.latest_commit:
+                return self.latest_commit
+            self.logger.error(f"Update check failed: {e}", exception=str(e))
+            print(f"Update check failed: {e}")
+            return None
+        except (URLError, json.JSONDecodeError, TimeoutError) as e:
             self.logger.error(f"Update check failed: {e}", exception=str(e))
             print(f"Update check failed: {e}")
             return None
@@ -132,14 +201,10 @@ class UpdateChecker:
         Returns:
             Dict with update info if available, None otherwise
         """
-        if not self.update_config['enabled']:
-            return None
-        
-        current_time = time.time()
-        check_interval = self.update_config['check_interval']
-        
         # Don't check if within interval (unless forced)
-        if not force and (current_time - self.update_config['last_check']) < check_interval:
+        if not force and time.monotonic() < self.next_check_at:
+            return None
+        if not self.update_config['enabled']:
             return None
         
         branch = self.update_config['branch']
@@ -152,8 +217,8 @@ class UpdateChecker:
         current_hash = self.get_current_commit()
         
         # Update last check time
-        self.update_config['last_check'] = current_time
-        self.save_update_config(self.update_config)
+        self.next_check_at = time.monotonic() + self.update_config['check_interval']
+        self.update_config['last_check'] = time.time()
         
         # If we don't have a stored commit, store current one
         if self.update_config['last_commit'] is None:
@@ -162,9 +227,9 @@ class UpdateChecker:
                 self.update_config['last_commit'] = current_hash[:7]
             elif latest_hash:
                 self.update_config['last_commit'] = latest_hash
-            if self.update_config['last_commit']:
-                self.save_update_config(self.update_config)
+            self.save_update_config(self.update_config)
             return None
+        self.save_update_config(self.update_config)
         
         # Check if update available
         stored_hash = self.update_config['last_commit']
@@ -186,15 +251,14 @@ class UpdateChecker:
             Tuple of (success: bool, message: str)
         """
         try:
-            repo_dir = os.path.dirname(os.path.abspath(__file__))
             branch = self.update_config['branch']
             
             # Fetch latest
             fetch_result = subprocess.run(
-                ['git', 'fetch', 'origin', branch],
+                [self.git_bin, 'fetch', 'origin', branch],
                 capture_output=True,
                 text=True,
-                cwd=repo_dir,
+                cwd=self.repo_dir,
                 timeout=30
             )
             
@@ -204,16 +268,17 @@ class UpdateChecker:
             
             # Pull latest
             pull_result = subprocess.run(
-                ['git', 'pull', 'origin', branch],
+                [self.git_bin, 'pull', 'origin', branch],
                 capture_output=True,
                 text=True,
-                cwd=repo_dir,
+                cwd=self.repo_dir,
                 timeout=30
             )
             
             if pull_result.returncode != 0:
                 self.logger.error("Git pull failed", error=pull_result.stderr)
                 return (False, f"Git pull failed: {pull_result.stderr}")
+            self.current_commit = None
             
             # Update stored commit
             latest = self.get_latest_commit(branch)
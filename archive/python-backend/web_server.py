@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import functools
 import cv2
 import numpy as np
 import json
@@ -7,7 +8,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 import os
-from typing import Optional
+from typing import Optional, Tuple
 from face_filters import FaceFilter
 import time
 from collections import deque
@@ -17,55 +18,143 @@ app = FastAPI()
 # Store active connections and their filter state
 active_connections = {}
 
+# Filters by category, in UI order
+# DROPOUT face masks are discovered dynamically from assets/dropout/face_mask/
+DISTORTION_FILTERS = (
+    'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
+    'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple',
+    'radial_blur', 'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
+    'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
+    'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
+    'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'fast_zoom_in',
+    'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom', 'extreme_closeup',
+    'puzzle', 'rotate', 'rotate_45', 'rotate_90', 'flip_horizontal',
+    'flip_vertical', 'flip_both', 'quad_mirror', 'tile', 'radial_tile',
+    'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
+)
+COLOR_STYLE_FILTERS = (
+    'black_white', 'sepia', 'vintage', 'neon_glow',
+    'pixelate', 'blur', 'sharpen', 'emboss', 'red_tint', 'blue_tint',
+    'green_tint', 'rainbow', 'negative', 'posterize', 'sketch', 'cartoon',
+    'thermal', 'ice', 'ocean', 'plasma', 'jet', 'turbo', 'inferno',
+    'magma', 'viridis', 'cool', 'hot', 'spring', 'summer', 'autumn',
+    'winter', 'rainbow_shift', 'acid_trip', 'vhs', 'retro', 'cyberpunk',
+    'anime', 'glow', 'solarize', 'edge_detect', 'halftone',
+)
+ALL_FILTERS = DISTORTION_FILTERS + COLOR_STYLE_FILTERS
+ALLOWED_FILTERS = frozenset(ALL_FILTERS)
+
+# Filters that take the frame count to animate
+ANIMATED_FILTERS = frozenset({
+    'extreme_closeup', 'puzzle', 'fast_zoom_in', 'fast_zoom_out',
+    'shake', 'pulse', 'spiral_zoom'
+})
+
+# Filters applied to the whole frame rather than a detected face
+FULL_IMAGE_FILTERS = frozenset({
+    'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
+    'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
+    'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
+    'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
+    'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
+    'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'rotate',
+    'rotate_45', 'rotate_90', 'flip_horizontal', 'flip_vertical',
+    'flip_both', 'quad_mirror', 'tile', 'radial_tile',
+    'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
+    'black_white', 'sepia', 'vintage', 'negative', 'posterize', 'sketch',
+    'cartoon', 'anime', 'thermal', 'ice', 'ocean', 'plasma', 'jet',
+    'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring',
+    'summer', 'autumn', 'winter', 'rainbow', 'rainbow_shift', 'acid_trip',
+    'vhs', 'retro', 'cyberpunk', 'glow', 'solarize', 'edge_detect',
+    'halftone', 'red_tint', 'blue_tint', 'green_tint', 'neon_glow',
+    'pixelate', 'blur', 'sharpen', 'emboss'
+})
+
 # Get all available filters organized by category
 def get_all_filters():
-    return [
-        # DROPOUT
-        # Face masks are discovered dynamically from assets/dropout/face_mask/
-        # Distortion
-        'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-        'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple',
-        'radial_blur', 'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
-        'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
-        'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
-        'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'fast_zoom_in',
-        'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom', 'extreme_closeup',
-        'puzzle', 'rotate', 'rotate_45', 'rotate_90', 'flip_horizontal',
-        'flip_vertical', 'flip_both', 'quad_mirror', 'tile', 'radial_tile',
-        'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
-        # Color & Style
-        'black_white', 'sepia', 'vintage', 'neon_glow',
-        'pixelate', 'blur', 'sharpen', 'emboss', 'red_tint', 'blue_tint',
-        'green_tint', 'rainbow', 'negative', 'posterize', 'sketch', 'cartoon',
-        'thermal', 'ice', 'ocean', 'plasma', 'jet', 'turbo', 'inferno',
-        'magma', 'viridis', 'cool', 'hot', 'spring', 'summer', 'autumn',
-        'winter', 'rainbow_shift', 'acid_trip', 'vhs', 'retro', 'cyberpunk',
-        'anime', 'glow', 'solarize', 'edge_detect', 'halftone'
-    ]
+    return list(ALL_FILTERS)
 
 # Get filters organized by category for UI grouping
 def get_filters_by_category():
     return {
         'DROPOUT': [],  # Face masks are discovered dynamically
-        'Distortion': ['bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-                      'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple',
-                      'radial_blur', 'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
-                      'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
-                      'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
-                      'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'fast_zoom_in',
-                      'fast_zoom_out', 'shake', 'pulse', 'spiral_zoom', 'extreme_closeup',
-                      'puzzle', 'rotate', 'rotate_45', 'rotate_90', 'flip_horizontal',
-                      'flip_vertical', 'flip_both', 'quad_mirror', 'tile', 'radial_tile',
-                      'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision'],
-        'Color & Style': ['black_white', 'sepia', 'vintage', 'neon_glow',
-                         'pixelate', 'blur', 'sharpen', 'emboss', 'red_tint', 'blue_tint',
-                         'green_tint', 'rainbow', 'negative', 'posterize', 'sketch', 'cartoon',
-                         'thermal', 'ice', 'ocean', 'plasma', 'jet', 'turbo', 'inferno',
-                         'magma', 'viridis', 'cool', 'hot', 'spring', 'summer', 'autumn',
-                         'winter', 'rainbow_shift', 'acid_trip', 'vhs', 'retro', 'cyberpunk',
-                         'anime', 'glow', 'solarize', 'edge_detect', 'halftone']
+        'Distortion': list(DISTORTION_FILTERS),
+        'Color & Style': list(COLOR_STYLE_FILTERS)
     }
 
+# Filters whose FaceFilter method isn't named apply_<filter>
+FILTER_METHOD_ALIASES = {'mirror': 'apply_mirror_split'}
+
+def build_filter_dispatch(filter_app: FaceFilter) -> dict:
+    """Resolve every allowed filter to (kind, bound FaceFilter method) once per connection"""
+    dispatch = {}
+    for filter_name in ALL_FILTERS:
+        if filter_name in ANIMATED_FILTERS:
+            kind = 'animated'
+        elif filter_name in FULL_IMAGE_FILTERS:
+            kind = 'full'
+        else:
+            kind = 'face'
+        method_name = FILTER_METHOD_ALIASES.get(filter_name, f'apply_{filter_name}')
+        filter_method = getattr(filter_app, method_name, None)
+        if filter_method and callable(filter_method):
+            dispatch[filter_name] = (kind, filter_method)
+    return dispatch
+
+# Faces move little between frames: detect every few frames, on a downscaled copy
+FACE_DETECT_INTERVAL = 3
+FACE_DETECT_WIDTH = 640
+
+def detect_faces(conn: dict, frame: np.ndarray, all_faces: bool = False):
+    """Detect faces for a connection, reusing the last result for FACE_DETECT_INTERVAL frames"""
+    frame_count = conn['frame_count']
+    key = (all_faces, frame.shape[:2])
+    cached = conn['face_cache'].get(key)
+    if cached is not None and 0 <= frame_count - cached[0] < FACE_DETECT_INTERVAL:
+        return cached[1]
+    
+    scale = min(1.0, FACE_DETECT_WIDTH / frame.shape[1])
+    if scale < 1.0:
+        small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        faces = [tuple(int(round(v / scale)) for v in face) for face in conn['filter_app'].detect_all_faces(small)]
+    else:
+        faces = conn['filter_app'].detect_all_faces(frame)
+    result = faces if all_faces else (faces[0] if faces else None)
+    conn['face_cache'][key] = (frame_count, result)
+    return result
+
+# Parse hierarchical filter names: <assets_folder>_<fx_type>_<fx_option>
+# Example: dropout_face_mask_<name> -> folder: dropout, type: face_mask, option: <name>
+def parse_filter_name(filter_name):
+    """Parse hierarchical filter name into components"""
+    parts = filter_name.split('_')
+    if len(parts) >= 3:
+        # Format: <folder>_<type>_<option>
+        folder = parts[0]
+        fx_type = '_'.join(parts[1:-1])  # Handle multi-word types
+        option = parts[-1]
+        return folder, fx_type, option
+    return None, None, None
+
+@functools.lru_cache(maxsize=64)
+def face_mask_route(filter_name: str) -> Optional[Tuple[str, str]]:
+    """Map a face mask filter name to (option, asset_dir), parsed once per name"""
+    folder, fx_type, option = parse_filter_name(filter_name)
+    if not (folder and fx_type == 'face_mask' and option):
+        return None
+    # Names arrive over the websocket, so keep the resolved path inside assets/
+    if any(part.startswith('.') or '/' in part or '\\' in part for part in (folder, option)):
+        return None
+    # Map to asset directory based on hierarchical structure
+    # Format: <folder>_<fx_type>_<option> -> assets/<folder>/<fx_type>/<option>.png
+    if folder == 'dropout':
+        asset_dir = 'assets/dropout/face_mask'
+    elif folder == 'assets':
+        asset_dir = 'assets/face_mask'
+    else:
+        asset_dir = f'assets/{folder}/face_mask'
+    return option, asset_dir
+
 # Serve static files if static directory exists
 static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static')
 if os.path.exists(static_dir):
@@ -149,6 +238,81 @@ async def get_filters_categories():
     categories = get_filters_by_category()
     return {"categories": categories}
 
+def process_frame(conn: dict, connection_id: int, image_bytes: bytes) -> Optional[np.ndarray]:
+    """Decode, filter and re-encode one frame; runs in a worker thread, off the event loop"""
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    
+    if frame is None:
+        return None
+    
+    # Skip processing if frame is too small (likely corrupted)
+    if frame.shape[0] < 10 or frame.shape[1] < 10:
+        return None
+    
+    # Apply filter if selected
+    filter_name = conn.get('filter')
+    filter_app = conn['filter_app']
+    filter_dispatch = conn['filter_dispatch']
+    frame_count = conn['frame_count']
+    
+    if filter_name:
+        # Debug logging
+        print(f"Processing frame with filter: {filter_name} (connection: {connection_id})")
+        try:
+            if filter_name in filter_dispatch:
+                kind, filter_method = filter_dispatch[filter_name]
+                if kind == 'animated':
+                    dummy_face = (0, 0, frame.shape[1], frame.shape[0])
+                    frame = filter_method(frame, dummy_face, frame_count)
+                elif kind == 'full':
+                    dummy_face = (0, 0, frame.shape[1], frame.shape[0])
+                    frame = filter_method(frame, dummy_face)
+                else:
+                    face = detect_faces(conn, frame)
+                    if face:
+                        frame = filter_method(frame, face)
+            elif 'face_mask' in filter_name:
+                # Face mask filters are resolved dynamically from their name
+                route = face_mask_route(filter_name)
+                if route:
+                    option, asset_dir = route
+                    
+                    # Use dynamic asset loading - same processing for all face masks
+                    print(f"[FILTER DEBUG] Applying face mask: filter='{filter_name}' -> asset='{option}', dir='{asset_dir}'")
+                    faces = detect_faces(conn, frame, all_faces=True)
+                    if faces and len(faces) > 0:
+                        print(f"[FILTER DEBUG] Found {len(faces)} face(s), applying mask '{option}' from '{asset_dir}'...")
+                        # Apply mask to all detected faces
+                        for face in faces:
+                            frame = filter_app.apply_face_mask_from_asset(frame, face, option, asset_dir=asset_dir)
+                        print(f"[FILTER DEBUG] Face mask '{option}' applied successfully for filter: {filter_name}")
+                    else:
+                        print(f"[FILTER DEBUG] No faces detected for filter: {filter_name}")
+                else:
+                    print(f"[FILTER DEBUG] Could not parse face mask filter name: {filter_name}")
+            else:
+                print(f"Warning: Filter method 'apply_{filter_name}' not found")
+        except Exception as e:
+            import traceback
+            print(f"Error applying filter {filter_name}: {e}")
+            traceback.print_exc()
+    
+    # Encode processed frame with lower quality for speed
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+    return buffer
+
+async def send_frame(websocket: WebSocket, buffer: np.ndarray, binary: bool):
+    """Send an encoded JPEG back in the form the client sent its frame"""
+    if binary:
+        await websocket.send_bytes(buffer.tobytes())
+    else:
+        frame_base64 = base64.b64encode(buffer).decode('utf-8')
+        await websocket.send_json({
+            'type': 'frame',
+            'data': f'data:image/jpeg;base64,{frame_base64}'
+        })
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
@@ -159,6 +323,8 @@ async def websocket_endpoint(websocket: WebSocket):
         'websocket': websocket,
         'filter': None,
         'filter_app': None,  # Will be created when needed
+        'filter_dispatch': {},
+        'face_cache': {},  # (all_faces, frame shape) -> (frame_count, faces)
         'frame_count': 0,
         'last_frame_time': 0,
         'frame_queue': deque(maxlen=2),  # Limit queue to prevent delay buildup
@@ -169,6 +335,7 @@ async def websocket_endpoint(websocket: WebSocket):
         filter_app = FaceFilter()
         # Don't call __enter__ since we're not using the camera
         active_connections[connection_id]['filter_app'] = filter_app
+        active_connections[connection_id]['filter_dispatch'] = build_filter_dispatch(filter_app)
     except Exception as e:
         print(f"Error initializing filter app: {e}")
         await websocket.close()
@@ -177,20 +344,31 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            # Receive message from client: binary messages are raw JPEG frames,
+            # text messages are JSON (filter changes, or base64 frames from older clients)
+            data = await websocket.receive()
+            if data['type'] == 'websocket.disconnect':
+                raise WebSocketDisconnect(data.get('code', 1000))
             
-            msg_type = message.get('type')
+            if data.get('bytes') is not None:
+                msg_type = 'frame'
+                frame_data = data['bytes']
+            else:
+                message = json.loads(data['text'])
+                msg_type = message.get('type')
+                frame_data = message.get('data')
             
             if msg_type == 'filter':
                 # Update filter selection immediately
                 filter_name = message.get('filter')
                 print(f"Received filter change request: {filter_name}")
-                if filter_name in get_all_filters() or filter_name is None:
+                # Face masks aren't in ALL_FILTERS; they're resolved from the name itself
+                if filter_name is None or (isinstance(filter_name, str) and (
+                        filter_name in ALLOWED_FILTERS or face_mask_route(filter_name) is not None)):
                     active_connections[connection_id]['filter'] = filter_name
                     # Reset frame count for animated filters
                     active_connections[connection_id]['frame_count'] = 0
+                    active_connections[connection_id]['face_cache'].clear()
                     # Clear frame queue to apply filter immediately
                     active_connections[connection_id]['frame_queue'].clear()
                     print(f"Filter set to: {filter_name or 'None'}")
@@ -209,7 +387,6 @@ async def websocket_endpoint(websocket: WebSocket):
                         pass
                 
                 # Process video frame
-                frame_data = message.get('data')
                 if not frame_data:
                     continue
                 
@@ -221,146 +398,28 @@ async def websocket_endpoint(websocket: WebSocket):
                     latest_frame_data = conn['frame_queue'][-1]
                     
                     try:
-                        # Decode base64 image (optimized)
-                        if ',' in latest_frame_data:
+                        binary = isinstance(latest_frame_data, bytes)
+                        if binary:
+                            image_bytes = latest_frame_data
+                        elif ',' in latest_frame_data:
                             image_bytes = base64.b64decode(latest_frame_data.split(',')[1])
                         else:
                             image_bytes = base64.b64decode(latest_frame_data)
-                        nparr = np.frombuffer(image_bytes, np.uint8)
-                        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
                         
-                        if frame is None:
+                        # Decoding, filtering and encoding take tens of ms; doing it in a
+                        # thread keeps the event loop serving the other connections
+                        buffer = await asyncio.to_thread(process_frame, conn, connection_id, image_bytes)
+                        if buffer is None:
                             continue
                         
-                        # Skip processing if frame is too small (likely corrupted)
-                        if frame.shape[0] < 10 or frame.shape[1] < 10:
-                            continue
+                        # Send processed frame back immediately
+                        await send_frame(websocket, buffer, binary)
                         
-                        # Apply filter if selected
-                        filter_name = conn.get('filter')
-                        filter_app = conn['filter_app']
-                        frame_count = conn['frame_count']
+                        conn['frame_count'] += 1
+                        conn['last_frame_time'] = time.time()
                         
-                        if filter_name:
-                            # Debug logging
-                            print(f"Processing frame with filter: {filter_name} (connection: {connection_id})")
-                            # Determine filter category
-                            animated_filters = {
-                                'extreme_closeup', 'puzzle', 'fast_zoom_in', 'fast_zoom_out', 
-                                'shake', 'pulse', 'spiral_zoom'
-                            }
-                            
-                            full_image_filters = {
-                                'bulge', 'stretch', 'swirl', 'fisheye', 'pinch', 'wave', 'mirror',
-                                'twirl', 'ripple', 'sphere', 'tunnel', 'water_ripple', 'radial_blur',
-                                'cylinder', 'barrel', 'pincushion', 'whirlpool', 'radial_zoom',
-                                'concave', 'convex', 'spiral', 'radial_stretch', 'radial_compress',
-                                'vertical_wave', 'horizontal_wave', 'skew_horizontal', 'skew_vertical',
-                                'rotate_zoom', 'radial_wave', 'zoom_in', 'zoom_out', 'rotate',
-                                'rotate_45', 'rotate_90', 'flip_horizontal', 'flip_vertical',
-                                'flip_both', 'quad_mirror', 'tile', 'radial_tile',
-                                'zoom_blur', 'melt', 'kaleidoscope', 'glitch', 'double_vision',
-                                'black_white', 'sepia', 'vintage', 'negative', 'posterize', 'sketch',
-                                'cartoon', 'anime', 'thermal', 'ice', 'ocean', 'plasma', 'jet',
-                                'turbo', 'inferno', 'magma', 'viridis', 'cool', 'hot', 'spring',
-                                'summer', 'autumn', 'winter', 'rainbow', 'rainbow_shift', 'acid_trip',
-                                'vhs', 'retro', 'cyberpunk', 'glow', 'solarize', 'edge_detect',
-                                'halftone', 'red_tint', 'blue_tint', 'green_tint', 'neon_glow',
-                                'pixelate', 'blur', 'sharpen', 'emboss'
-                            }
-                            
-                            # Parse hierarchical filter names: <assets_folder>_<fx_type>_<fx_option>
-                            # Example: dropout_face_mask_<name> -> folder: dropout, type: face_mask, option: <name>
-                            def parse_filter_name(filter_name):
-                                """Parse hierarchical filter name into components"""
-                                parts = filter_name.split('_')
-                                if len(parts) >= 3:
-                                    # Format: <folder>_<type>_<option>
-                                    folder = parts[0]
-                                    fx_type = '_'.join(parts[1:-1])  # Handle multi-word types
-                                    option = parts[-1]
-                                    return folder, fx_type, option
-                                return None, None, None
-                            
-                            try:
-                                # Check if this is a face mask filter dynamically
-                                if 'face_mask' in filter_name:
-                                    folder, fx_type, option = parse_filter_name(filter_name)
-                                    if folder and fx_type == 'face_mask' and option:
-                                        # Map to asset directory based on hierarchical structure
-                                        # Format: <folder>_<fx_type>_<option> -> assets/<folder>/<fx_type>/<option>.png
-                                        if folder == 'dropout':
-                                            asset_dir = 'assets/dropout/face_mask'
-                                        elif folder == 'assets':
-                                            asset_dir = 'assets/face_mask'
-                                        else:
-                                            asset_dir = f'assets/{folder}/face_mask'
-                                        
-                                        # Use dynamic asset loading - same processing for all face masks
-                                        print(f"[FILTER DEBUG] Applying face mask: filter='{filter_name}' -> asset='{option}', dir='{asset_dir}'")
-                                        faces = filter_app.detect_all_faces(frame)
-                                        if faces and len(faces) > 0:
-                                            print(f"[FILTER DEBUG] Found {len(faces)} face(s), applying mask '{option}' from '{asset_dir}'...")
-                                            # Apply mask to all detected faces
-                                            for face in faces:
-                                                frame = filter_app.apply_face_mask_from_asset(frame.copy(), face, option, asset_dir=asset_dir)
-                                            print(f"[FILTER DEBUG] Face mask '{option}' applied successfully for filter: {filter_name}")
-                                        else:
-                                            print(f"[FILTER DEBUG] No faces detected for filter: {filter_name}")
-                                        else:
-                                            print(f"[FILTER DEBUG] Could not parse face mask filter name: {filter_name}")
-                                elif filter_name in animated_filters:
-                                    dummy_face = (0, 0, frame.shape[1], frame.shape[0])
-                                    filter_method = getattr(filter_app, f'apply_{filter_name}', None)
-                                    if filter_method and callable(filter_method):
-                                        frame = filter_method(frame.copy(), dummy_face, frame_count)
-                                elif filter_name in full_image_filters:
-                                    dummy_face = (0, 0, frame.shape[1], frame.shape[0])
-                                    filter_method = getattr(filter_app, f'apply_{filter_name}', None)
-                                    if filter_method and callable(filter_method):
-                                        frame = filter_method(frame.copy(), dummy_face)
-                                else:
-                                    # Try to find filter method by name
-                                    filter_method = getattr(filter_app, f'apply_{filter_name}', None)
-                                    if filter_method and callable(filter_method):
-                                        face = filter_app.detect_face(frame)
-                                        if face:
-                                            frame = filter_method(frame.copy(), face)
-                                    else:
-                                        print(f"Warning: Filter method 'apply_{filter_name}' not found")
-                            except Exception as e:
-                                import traceback
-                                print(f"Error applying filter {filter_name}: {e}")
-                                traceback.print_exc()
-                            
-                            # Encode processed frame with lower quality for speed
-                            _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-                            frame_base64 = base64.b64encode(buffer).decode('utf-8')
-                            
-                            # Send processed frame back immediately
-                            await websocket.send_json({
-                                'type': 'frame',
-                                'data': f'data:image/jpeg;base64,{frame_base64}'
-                            })
-                            
-                            conn['frame_count'] += 1
-                            conn['last_frame_time'] = time.time()
-                            
-                            # Clear queue after successful processing
-                            conn['frame_queue'].clear()
-                        else:
-                            # No filter - send original frame quickly
-                            _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-                            frame_base64 = base64.b64encode(buffer).decode('utf-8')
-                            
-                            await websocket.send_json({
-                                'type': 'frame',
-                                'data': f'data:image/jpeg;base64,{frame_base64}'
-                            })
-                            
-                            conn['frame_count'] += 1
-                            conn['last_frame_time'] = time.time()
-                            conn['frame_queue'].clear()
+                        # Clear queue after successful processing
+                        conn['frame_queue'].clear()
                         
                     except Exception as e:
                         print(f"Error processing frame: {e}")